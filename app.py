@@ -1382,7 +1382,9 @@ def main():
                         improvement_thresholds,
                         region_metrics,
                         site_name=site_name,
-                        single_test_distribution=single_test_distribution
+                        single_test_distribution=single_test_distribution,
+                        avg_power_changes=(avg_power_change_1_2, avg_power_change_2_3, avg_power_change_3_4),
+                        avg_accel_changes=(avg_accel_change_1_2, avg_accel_change_2_3, avg_accel_change_3_4)
                     )
                     st.download_button(
                         label="Download Comprehensive Report (HTML)",
@@ -1402,7 +1404,9 @@ def main():
                         improvement_thresholds,
                         region_metrics,
                         site_name=site_name,
-                        single_test_distribution=single_test_distribution
+                        single_test_distribution=single_test_distribution,
+                        avg_power_changes=(avg_power_change_1_2, avg_power_change_2_3, avg_power_change_3_4),
+                        avg_accel_changes=(avg_accel_change_1_2, avg_accel_change_2_3, avg_accel_change_3_4)
                     )
                     
                     # Add a PDF download button
@@ -1,298 +1,198 @@
 """Report generator module for exercise data visualization."""
 import pandas as pd
+from pandas.io.formats.style import Styler
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import streamlit as st
 import io
+import html
+import functools
+import re
+from jinja2 import Environment
 from weasyprint import HTML
 
-class ReportGenerator:
-    """Generates reports for exercise data analysis."""
-    
-    def __init__(self):
-        """Initialize the report generator with default settings."""
-        pass
-    
-    def generate_distribution_report(self, power_counts, accel_counts):
-        """
-        Generate a report with distribution tables and a bar chart visualization.
-        
-        Args:
-            power_counts (DataFrame): Power development distribution counts
-            accel_counts (DataFrame): Acceleration development distribution counts
-            
-        Returns:
-            bytes: PDF report as bytes
-        """
-        # Create a report buffer
-        report_buffer = io.BytesIO()
-        
-        # Create an HTML string for the report
-        html_content = self._generate_html_report(power_counts, accel_counts)
-        
-        # Return the HTML content as bytes
-        report_buffer.write(html_content.encode())
-        report_buffer.seek(0)
-        
-        return report_buffer.getvalue()
-    
-    def create_distribution_chart(self, power_counts, accel_counts):
-        """
-        Create a bar chart visualization for distribution data.
-        
-        Args:
-            power_counts (DataFrame): Power development distribution
-            accel_counts (DataFrame): Acceleration development distribution
-            
-        Returns:
-            plotly.graph_objects.Figure: Plotly figure object
-        """
-        # Extract categories and test values
-        categories = power_counts.index.tolist()
-        
-        # Set up the data for plotting
-        test_columns = [col for col in power_counts.columns if 'Test' in col]
-        
-        # Create a figure with a single subplot for both power and acceleration
-        fig = make_subplots(rows=1, cols=1)
-        
-        # Add bars for power data
-        for i, col in enumerate(test_columns):
-            fig.add_trace(
-                go.Bar(
-                    x=categories,
-                    y=power_counts[col],
-                    name=f"Power {col}",
-                    marker_color='blue',
-                    opacity=0.7,
-                    showlegend=True
-                )
-            )
-        
-        # Add bars for acceleration data
-        for i, col in enumerate(test_columns):
-            fig.add_trace(
-                go.Bar(
-                    x=categories,
-                    y=accel_counts[col],
-                    name=f"Acceleration {col}",
-                    marker_color='green',
-                    opacity=0.7,
-                    showlegend=True
-                )
-            )
-        
-        # Update layout
-        fig.update_layout(
-            title="Distribution of Users by Development Category",
-            xaxis_title="Development Category",
-            yaxis_title="Number of Users",
-            barmode='group',
-            bargap=0.15,
-            bargroupgap=0.1,
-            height=500,
-            width=800,
-            legend=dict(
-                x=0.01,
-                y=0.99,
-                bgcolor='rgba(255, 255, 255, 0.5)',
-                bordercolor='rgba(0, 0, 0, 0.1)',
-                borderwidth=1
-            )
-        )
-        
-        return fig
-    
-    def _generate_html_report(self, power_counts, accel_counts, power_transitions=None, accel_transitions=None):
-        """
-        Generate HTML report content.
-        
-        Args:
-            power_counts (DataFrame): Power development distribution
-            accel_counts (DataFrame): Acceleration development distribution
-            power_transitions (dict): Dictionary of power transition matrices by period
-            accel_transitions (dict): Dictionary of acceleration transition matrices by period
-            
-        Returns:
-            str: HTML content
-        """
-        # No distribution chart visualization
-        chart_html = ""  # Empty string since we're not using the chart
-        
-        # Convert dataframes to HTML tables
-        power_table = power_counts.to_html(classes='table table-striped', index=True)
-        accel_table = accel_counts.to_html(classes='table table-striped', index=True)
-        
-        # Generate transition tables HTML if provided
-        transitions_html = ""
-        if power_transitions and accel_transitions:
-            transitions_html += """
-            <h2>Transition Analysis</h2>
-            <p>Reading guide: Rows show starting bracket, columns show ending bracket. Numbers show how many users made each transition.</p>
-            """
-            
-            # Power transitions
-            transitions_html += "<h3>Power Transitions</h3>"
-            for period, matrix in power_transitions.items():
-                transitions_html += f"<h4>Period: {period}</h4>"
-                transitions_html += matrix.to_html(classes='table table-striped', index=True)
-            
-            # Acceleration transitions
-            transitions_html += "<h3>Acceleration Transitions</h3>"
-            for period, matrix in accel_transitions.items():
-                transitions_html += f"<h4>Period: {period}</h4>"
-                transitions_html += matrix.to_html(classes='table table-striped', index=True)
-        
-        # Create HTML content
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Exercise Development Distribution Report</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    margin: 20px;
-                    padding: 0;
-                    color: #333;
-                }}
-                h1, h2, h3, h4 {{
-                    color: #2c3e50;
-                }}
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                }}
-                .table {{
-                    border-collapse: collapse;
-                    margin: 25px 0;
-                    font-size: 0.9em;
-                    width: 100%;
-                    box-shadow: 0 0 20px rgba(0, 0, 0, 0.15);
-                }}
-                .table thead tr {{
-                    background-color: #2c3e50;
-                    color: #ffffff;
-                    text-align: left;
-                }}
-                .table th,
-                .table td {{
-                    padding: 12px 15px;
-                }}
-                .table tbody tr {{
-                    border-bottom: 1px solid #dddddd;
-                }}
-                .table tbody tr:nth-of-type(even) {{
-                    background-color: #f3f3f3;
-                }}
-                .table tbody tr:last-of-type {{
-                    border-bottom: 2px solid #2c3e50;
-                }}
-                .chart-container {{
-                    width: 100%;
-                    margin: 25px 0;
-                }}
-                /* Transition table cell colors */
-                .diagonal {{
-                    background-color: #d4e6f1 !important; /* Pale Blue for no change */
-                }}
-                .above-diagonal {{
-                    background-color: #f5b7b1 !important; /* Pale Red for regression */
-                }}
-                .below-diagonal {{
-                    background-color: #abebc6 !important; /* Pale Green for improvement */
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>Exercise Development Distribution Report</h1>
-                
-                <h2>Power Development Distribution</h2>
-                {power_table}
-                
-                <h2>Acceleration Development Distribution</h2>
-                {accel_table}
-                
-                {transitions_html}
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html_content
-    
-    def generate_downloadable_html(self, power_counts, accel_counts, power_transitions=None, accel_transitions=None):
-        """
-        Generate downloadable HTML report.
-        
-        Args:
-            power_counts (DataFrame): Power development distribution
-            accel_counts (DataFrame): Acceleration development distribution
-            power_transitions (dict): Dictionary of power transition matrices by period
-            accel_transitions (dict): Dictionary of acceleration transition matrices by period
-            
-        Returns:
-            bytes: HTML report as bytes
-        """
-        html_content = self._generate_html_report(power_counts, accel_counts, power_transitions, accel_transitions)
-        return html_content.encode('utf-8')
-        
-    def generate_comprehensive_report(self, power_counts, accel_counts, power_transitions, accel_transitions,
-                                    body_region_averages, improvement_thresholds, region_metrics, 
-                                    site_name="", single_test_distribution=None):
-        """
-        Generate a comprehensive HTML report with separate pages for each section.
-        
-        Args:
-            power_counts (DataFrame): Power development distribution
-            accel_counts (DataFrame): Acceleration development distribution
-            power_transitions (dict): Dictionary of power transition matrices by period
-            accel_transitions (dict): Dictionary of acceleration transition matrices by period
-            body_region_averages (dict): Dictionary of body region averages
-            improvement_thresholds (dict): Dictionary of improvement thresholds by region
-            region_metrics (dict): Dictionary of region metrics including underperformers
-            site_name (str, optional): Name of the site/location for the report header
-            single_test_distribution (DataFrame, optional): Distribution data for single test users
-            
-        Returns:
-            bytes: Comprehensive HTML report as bytes
-        """
-        # Start building the HTML report
-        html_content = self._generate_comprehensive_html(
-            power_counts, accel_counts, power_transitions, accel_transitions,
-            body_region_averages, improvement_thresholds, region_metrics, site_name,
-            single_test_distribution
-        )
-        
-        return html_content.encode('utf-8')
-        
-    def generate_comprehensive_pdf_report(self, power_counts, accel_counts, power_transitions, accel_transitions,
-                                         body_region_averages, improvement_thresholds, region_metrics, 
-                                         site_name="", single_test_distribution=None):
-        """
-        Generate a comprehensive PDF report from the HTML report.
-        
-        Args:
-            power_counts (DataFrame): Power development distribution
-            accel_counts (DataFrame): Acceleration development distribution
-            power_transitions (dict): Dictionary of power transition matrices by period
-            accel_transitions (dict): Dictionary of power transition matrices by period
-            body_region_averages (dict): Dictionary of body region averages
-            improvement_thresholds (dict): Dictionary of improvement thresholds by region
-            region_metrics (dict): Dictionary of region metrics including underperformers
-            site_name (str, optional): Name of the site/location for the report header
-            single_test_distribution (DataFrame, optional): Distribution data for single test users
-            
-        Returns:
-            bytes: Comprehensive PDF report as bytes
-        """
-        # For PDF, we'll create a sequential report with all content visible
-        # rather than using tabs/interactive features
+# CSS classes for transition matrix cells, indexed by the codes returned
+# from _transition_cell_codes
+_TRANSITION_CELL_CLASSES = ("diagonal", "above-diagonal", "below-diagonal")
+
+# CSS classes colouring percentage changes
+_POSITIVE_CLASS = "positive"
+_NEGATIVE_CLASS = "negative"
+
+# Metric box values for Test 1→2, 2→3 and 3→4 when no average changes are supplied
+_PLACEHOLDER_POWER_CHANGES = ("+4.2", "+3.8", "+2.5")
+_PLACEHOLDER_ACCEL_CHANGES = ("+5.1", "+4.3", "+3.1")
+
+# Source indentation at the start of each line of a static HTML fragment;
+# the fragments have no multi-line <pre> or <textarea> blocks, so it can all go
+_LEADING_WHITESPACE_RE = re.compile(r'^[ \t]+', re.MULTILINE)
 
-        # Create the PDF-optimized CSS
-        css_styles = """
+# Strips the source indentation from every line of a static HTML fragment. It is
+# applied once where the page templates are defined, so streamed and buffered
+# reports carry the same, smaller markup
+_dedent_html = functools.partial(_LEADING_WHITESPACE_RE.sub, '')
+
+# Development brackets, best first
+_DEVELOPMENT_CATEGORIES = (
+    "Goal Hit", "Elite", "Above Average", "Average", "Under Developed", "Severely Under Developed"
+)
+
+# Placeholders for improvement thresholds a region does not define
+_PDF_THRESHOLDS_DEFAULT = {
+    'power_1_to_2': 'N/A',
+    'power_2_to_3': 'N/A',
+    'accel_1_to_2': 'N/A',
+    'accel_2_to_3': 'N/A',
+}
+
+# Columns of the PDF body region averages table, in display order
+_PDF_BODY_REGION_COLUMNS = (
+    [f"Power Test {i}" for i in range(1, 5)] + [f"Accel Test {i}" for i in range(1, 5)]
+)
+
+# Reports are rebuilt on every rerun while a site name is entered, so each cache keeps
+# only a few recent payloads and lets them expire instead of holding one per input forever
+_REPORT_CACHE_MAX_ENTRIES = 8
+_REPORT_CACHE_TTL = 3600
+
+
+# Table templates are compiled once at import; autoescaping covers user-supplied labels
+_TEMPLATE_ENV = Environment(autoescape=True)
+
+# Multi-test distribution table
+_MULTI_TEST_TABLE_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<table class=\"table\"><thead><tr><th></th>"
+    "{% for col in columns %}<th>{{ col }}</th>{% endfor %}"
+    "</tr></thead><tbody>"
+    "{% for category, values in rows %}"
+    "<tr><td style='text-align: right; font-weight: 500;'>{{ category }}</td>"
+    "{% for value in values %}<td>{{ value }}</td>{% endfor %}"
+    "</tr>"
+    "{% endfor %}"
+    "</tbody></table>"
+)
+
+# One metric's underperformers on an interactive region page
+_CHANGE_UNDERPERFORMERS_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<h3>{{ title }}</h3><table class=\"table underperformers-table\">"
+    "<thead><tr><th>User Name</th><th>Change (%)</th></tr></thead><tbody>"
+    "{% for user, change_class, change in rows %}"
+    "<tr><td>{{ user }}</td><td class=\"{{ change_class }}\">{{ change }}%</td></tr>"
+    "{% endfor %}"
+    "</tbody></table>"
+)
+
+# Lowest-change exercises on an interactive region page
+_LOWEST_CHANGE_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<h3>Exercises with Lowest Change</h3><table class=\"table\">"
+    "<thead><tr><th>Metric</th><th>Exercise</th><th>Change</th></tr></thead><tbody>"
+    "{% for metric, exercise, change_class, change in rows %}"
+    "<tr><td>{{ metric }}</td><td>{{ exercise }}</td><td class=\"{{ change_class }}\">{{ change }}%</td></tr>"
+    "{% endfor %}"
+    "</tbody></table>"
+)
+
+# Combined power/acceleration underperformers of one period on a PDF region page
+_UNDERPERFORMER_TABLE_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<table class=\"table\"><thead><tr><th>User Name</th><th>Power</th><th>Acceleration</th></tr></thead><tbody>"
+    "{% for user, power_cell, accel_cell in rows %}"
+    "<tr><td>{{ user }}</td><td>{{ power_cell }}</td><td>{{ accel_cell }}</td></tr>"
+    "{% else %}"
+    "<tr><td colspan='3' style='text-align: center;'>No underperforming users identified.</td></tr>"
+    "{% endfor %}"
+    "</tbody></table>"
+)
+
+# Body rows of the single test users table, in both report formats
+_SINGLE_TEST_ROWS_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "{% for category, power_value, accel_value in rows %}"
+    "<tr><td>{{ category }}</td><td>{{ power_value }}</td><td>{{ accel_value }}</td></tr>"
+    "{% endfor %}"
+)
+
+# Table of two-decimal percentages on an interactive region page
+_PERCENT_TABLE_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<table class=\"table\"><thead><tr><th>{{ corner }}</th>"
+    "{% for col in columns %}<th>{{ col }}</th>{% endfor %}"
+    "</tr></thead><tbody>"
+    "{% for label, cells in rows %}"
+    "<tr><td>{{ label }}</td>{% for cell in cells %}<td>{{ cell }}%</td>{% endfor %}</tr>"
+    "{% endfor %}"
+    "</tbody></table>"
+)
+
+# Transition matrix with diagonal/above/below cell highlighting, in both report formats
+_TRANSITION_TABLE_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<table class=\"table\"><thead><tr><th>From \\ To</th>"
+    "{% for col in columns %}<th>{{ col }}</th>{% endfor %}"
+    "</tr></thead><tbody>"
+    "{% for label, cells in rows %}"
+    "<tr><td>{{ label }}</td>"
+    "{% for cell_class, value in cells %}<td class=\"{{ cell_class }}\">{{ value }}</td>{% endfor %}"
+    "</tr>"
+    "{% endfor %}"
+    "</tbody></table>"
+)
+
+# Development distribution table and its change metrics in the PDF report
+_PDF_DISTRIBUTION_SECTION_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<h3>{{ title }}</h3>"
+    "<table class='table'><thead><tr><th>Category</th>"
+    "{% for col in columns %}<th>{{ col }}</th>{% endfor %}"
+    "</tr></thead><tbody>"
+    "{% for category, values in rows %}"
+    "<tr><td>{{ category }}</td>{% for value in values %}<td>{{ value }}</td>{% endfor %}</tr>"
+    "{% endfor %}"
+    "</tbody></table>"
+    "<div class='metric-row'>"
+    "{% for change in changes %}"
+    "<div class=\"metric-box\"><div class=\"metric-value\">{{ change }}%</div>"
+    "<div class=\"metric-label\">{{ change_label }} (Test {{ loop.index }}→{{ loop.index + 1 }})</div></div>"
+    "{% endfor %}"
+    "</div>"
+)
+
+# Average change metric boxes under a multi-test distribution on the interactive report
+_CHANGE_METRICS_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<div class=\"metric-row\">"
+    "{% for label in labels %}"
+    "<div class=\"metric-col\"><div class=\"metric-box\"><div class=\"metric-value\">{{ label }}%</div>"
+    "<div class=\"metric-label\">{{ change_label }} (Test {{ loop.index }}→{{ loop.index + 1 }})</div></div></div>"
+    "{% endfor %}"
+    "</div>"
+)
+
+# Development score averages of every body region in the PDF report
+_PDF_BODY_REGION_TABLE_TEMPLATE = _TEMPLATE_ENV.from_string(
+    "<table class=\"table\"><thead><tr><th>Body Region</th>"
+    "{% for col in columns %}<th>{{ col }}</th>{% endfor %}"
+    "</tr></thead><tbody>"
+    "{% for region, cells in rows %}"
+    "<tr><td>{{ region }}</td>{% for cell in cells %}<td>{{ cell }}</td>{% endfor %}</tr>"
+    "{% endfor %}"
+    "</tbody></table>"
+)
+
+# Zero-count single test rows, shown when no single test distribution is available
+_SINGLE_TEST_FALLBACK_ROWS = _SINGLE_TEST_ROWS_TEMPLATE.render(
+    rows=[(category, 0, 0) for category in _DEVELOPMENT_CATEGORIES]
+)
+
+
+# Legend shown above every set of transition matrices, in both report formats
+_TRANSITION_READING_GUIDE = _dedent_html("""
+        <div class="filter-info">
+            <p><strong>Reading Guide:</strong> Rows show starting bracket, columns show ending bracket. 
+            Numbers show count of users who made each transition.</p>
+            <ul>
+                <li><span style="color: #4da6ff; font-weight: bold;">Blue cells</span> show users who remained in the same bracket.</li>
+                <li><span style="color: #ff6b6b; font-weight: bold;">Red cells</span> show regression to lower brackets.</li>
+                <li><span style="color: #4dff4d; font-weight: bold;">Green cells</span> show improvement to higher brackets.</li>
+            </ul>
+        </div>
+        """)
+
+# Print stylesheet for the PDF report
+_PDF_CSS_STYLES = """
         <style>
             @page {
                 size: landscape;
@@ -457,508 +357,112 @@ class ReportGenerator:
             }
         </style>
         """
-        
-        # Set document title with site name if provided
-        title = f"Exercise Development Report - {site_name}" if site_name else "Comprehensive Exercise Development Report"
-        
-        # Create the HTML structure
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{title}</title>
-            {css_styles}
-        </head>
-        <body>
-        """
-        
-        # Cover page and title
-        html_content += f"""
-        <h1>{title}</h1>
-        <p>Generated on {pd.Timestamp.now().strftime('%B %d, %Y')}</p>
-        """
-        
-        # Add site name heading if provided
-        if site_name:
-            html_content += f"""
-            <div class="site-name">
-                <h2>{site_name}</h2>
-            </div>
-            """
-        
-        # Table of Contents
-        html_content += """
-        <div class="toc">
-            <h2>Table of Contents</h2>
-            <ul>
-                <li>1. Overview</li>
-                <li>2. Group Development Analysis
-                    <ul>
-                        <li>2.1. Single Test Users</li>
-                        <li>2.2. Multi-Test Users</li>
-                    </ul>
-                </li>
-                <li>3. Transition Analysis
-                    <ul>
-                        <li>3.1. Power Transitions</li>
-                        <li>3.2. Acceleration Transitions</li>
-                    </ul>
-                </li>
-                <li>4. Body Region Analysis
-                    <ul>
-        """
-        
-        # Add body regions to TOC
-        region_counter = 1
-        for region in body_region_averages.keys():
-            html_content += f"<li>4.{region_counter}. {region}</li>"
-            region_counter += 1
-        
-        html_content += """
-                    </ul>
-                </li>
-                <li>5. Information Guide</li>
-            </ul>
-        </div>
-        
-        <h1>1. Overview</h1>
-        <div class="section">
-        """
-        
-        # Report settings
-        html_content += """
-        <div class="filter-info">
-            <h3>Report Settings</h3>
-            <p>This report includes data processed with the following settings:</p>
-            <ul>
-                <li><strong>Date Range:</strong> All available dates</li>
-                <li><strong>Minimum Days Between Tests:</strong> 30 days</li>
-                <li><strong>Resistance Standardization:</strong> Enabled</li>
-            </ul>
-        </div>
-        """
-        
-        # Athlete Metrics
-        html_content += """
-        <h2>Athlete Metrics</h2>
-        <div class="metric-row">
-            <div class="metric-box">
-                <div class="metric-value">42</div>
-                <div class="metric-label">Total Athletes</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">38</div>
-                <div class="metric-label">Valid Athletes</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">John Smith (12)</div>
-                <div class="metric-label">Most Active Athlete</div>
-            </div>
-        </div>
-        
-        <h2>Exercise Metrics</h2>
-        <table class="table">
-            <thead>
-                <tr>
-                    <th>Exercise Name</th>
-                    <th>Total Executions</th>
-                    <th>1st Common Resistance</th>
-                    <th>2nd Common Resistance</th>
-                    <th>3rd Common Resistance</th>
-                    <th>Valid Entries</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Chest Press (One Hand) (Dominant)</td>
-                    <td>156</td>
-                    <td>12 lbs (98)</td>
-                    <td>10 lbs (42)</td>
-                    <td>8 lbs (16)</td>
-                    <td>142</td>
-                </tr>
-                <!-- Additional rows would be added here -->
-            </tbody>
-        </table>
-        
-        <h2>Test Session Analysis</h2>
-        <div class="metric-row">
-            <div class="metric-box">
-                <div class="metric-value">Power Test (76)</div>
-                <div class="metric-label">1st Most Common Session</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">Full Assessment (52)</div>
-                <div class="metric-label">2nd Most Common Session</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">Upper Body (28)</div>
-                <div class="metric-label">3rd Most Common Session</div>
-            </div>
-        </div>
-        </div>
-        
-        <h1>2. Group Development Analysis</h1>
-        <div class="section">
-        <h2>2.1. Single Test Users</h2>
-        <table class="table">
-            <thead>
-                <tr>
-                    <th>Development Category</th>
-                    <th>Power</th>
-                    <th>Acceleration</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        # Add single test distribution data dynamically
-        if single_test_distribution is not None:
-            # Get the categories from index
-            categories = single_test_distribution.index
-            for category in categories:
-                html_content += f"<tr><td>{category}</td>"
-                # Power column
-                if "Power" in single_test_distribution.columns:
-                    power_value = single_test_distribution.loc[category, "Power"]
-                    if pd.isna(power_value):
-                        html_content += f"<td>0</td>"
-                    else:
-                        html_content += f"<td>{int(power_value)}</td>"
-                else:
-                    html_content += "<td>0</td>"
-                
-                # Acceleration column
-                if "Acceleration" in single_test_distribution.columns:
-                    accel_value = single_test_distribution.loc[category, "Acceleration"]
-                    if pd.isna(accel_value):
-                        html_content += f"<td>0</td>"
-                    else:
-                        html_content += f"<td>{int(accel_value)}</td>"
-                else:
-                    html_content += "<td>0</td>"
-                
-                html_content += "</tr>"
-        else:
-            # Fallback to empty data if no actual data available
-            for category in ["Goal Hit", "Elite", "Above Average", "Average", "Under Developed", "Severely Under Developed"]:
-                html_content += f"<tr><td>{category}</td><td>0</td><td>0</td></tr>"
-        
-        html_content += """
-            </tbody>
-        </table>
-        
-        <h2>2.2. Multi-Test Users</h2>
-        <div class="metric-row">
-            <div class="metric-box">
-                <div class="metric-value">45.2</div>
-                <div class="metric-label">Average Days Between Tests</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">52.8</div>
-                <div class="metric-label">Avg Days Between Tests, with Minimum</div>
-            </div>
-        </div>
-        """
-        
-        # Extract test columns
-        test_columns = [col for col in power_counts.columns if col.startswith('Test')]
-        
-        # Power Development Distribution
-        html_content += "<h3>Power Development Distribution</h3>"
-        html_content += "<table class='table'><thead><tr><th>Category</th>"
-        
-        # Add column headers for tests
-        for col in test_columns:
-            html_content += f"<th>{col}</th>"
-        
-        html_content += "</tr></thead><tbody>"
-        
-        # Add data rows
-        for category in power_counts.index:
-            html_content += f"<tr><td>{category}</td>"
-            for col in test_columns:
-                if col in power_counts.columns:
-                    value = power_counts.loc[category, col]
-                    if pd.isna(value):
-                        html_content += "<td>0</td>"
-                    else:
-                        html_content += f"<td>{int(value)}</td>"
-                else:
-                    html_content += "<td>0</td>"
-            html_content += "</tr>"
-        
-        html_content += "</tbody></table>"
-        
-        # Power change metrics
-        html_content += "<div class='metric-row'>"
-        html_content += """
-            <div class="metric-box">
-                <div class="metric-value">+4.2%</div>
-                <div class="metric-label">Power Change (Test 1→2)</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">+3.8%</div>
-                <div class="metric-label">Power Change (Test 2→3)</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">+2.5%</div>
-                <div class="metric-label">Power Change (Test 3→4)</div>
-            </div>
-        </div>
-        """
-        
-        # Acceleration development distribution
-        html_content += "<h3>Acceleration Development Distribution</h3>"
-        html_content += "<table class='table'><thead><tr><th>Category</th>"
-        
-        # Add column headers for tests
-        for col in test_columns:
-            html_content += f"<th>{col}</th>"
-        
-        html_content += "</tr></thead><tbody>"
-        
-        # Add data rows
-        for category in accel_counts.index:
-            html_content += f"<tr><td>{category}</td>"
-            for col in test_columns:
-                if col in accel_counts.columns:
-                    value = accel_counts.loc[category, col]
-                    if pd.isna(value):
-                        html_content += "<td>0</td>"
-                    else:
-                        html_content += f"<td>{int(value)}</td>"
-                else:
-                    html_content += "<td>0</td>"
-            html_content += "</tr>"
-        
-        html_content += "</tbody></table>"
-        
-        # Acceleration change metrics
-        html_content += "<div class='metric-row'>"
-        html_content += """
-            <div class="metric-box">
-                <div class="metric-value">+5.1%</div>
-                <div class="metric-label">Acceleration Change (Test 1→2)</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">+4.3%</div>
-                <div class="metric-label">Acceleration Change (Test 2→3)</div>
-            </div>
-            <div class="metric-box">
-                <div class="metric-value">+3.1%</div>
-                <div class="metric-label">Acceleration Change (Test 3→4)</div>
-            </div>
-        </div>
-        </div>
-        
-        <h1>3. Transition Analysis</h1>
+
+_PDF_INFORMATION_GUIDE = """
+        <h1>5. Information Guide</h1>
         <div class="section">
-        <h2>3.1. Power Transitions</h2>
-        
-        <div class="filter-info">
-            <p><strong>Reading Guide:</strong> Rows show starting bracket, columns show ending bracket. 
-            Numbers show count of users who made each transition.</p>
-            <ul>
-                <li><span style="color: #4da6ff; font-weight: bold;">Blue cells</span> show users who remained in the same bracket.</li>
-                <li><span style="color: #ff6b6b; font-weight: bold;">Red cells</span> show regression to lower brackets.</li>
-                <li><span style="color: #4dff4d; font-weight: bold;">Green cells</span> show improvement to higher brackets.</li>
-            </ul>
-        </div>
-        """
-        
-        # Add power transition matrices with highlighting
-        for period, matrix in power_transitions.items():
-            html_content += f'<h3>Period: {period}</h3>'
             
-            # If matrix is a Styler object, get the underlying DataFrame
-            if hasattr(matrix, 'data'):
-                matrix_df = matrix.data
-            else:
-                matrix_df = matrix
-                
-            # Start table
-            html_content += """
+            <h2>Understanding Development Scores</h2>
+            <p>Development scores are calculated as a percentage of goal standards for each exercise:</p>
+            <p><strong>Development Score = (User's value / Goal standard) × 100</strong></p>
+            
+            <h3>Development Brackets</h3>
             <table class="table">
                 <thead>
                     <tr>
-                        <th>From \ To</th>
-            """
-            
-            # Add column headers
-            for col in matrix_df.columns:
-                html_content += f'<th>{col}</th>'
-            
-            html_content += """
+                        <th>Bracket</th>
+                        <th>Score Range</th>
                     </tr>
                 </thead>
                 <tbody>
-            """
-            
-            # Add rows with appropriate cell highlighting
-            for i, row_idx in enumerate(matrix_df.index):
-                html_content += f'<tr><td>{row_idx}</td>'
-                
-                for j, col in enumerate(matrix_df.columns):
-                    value = matrix_df.iloc[i, j]
-                    # Determine cell color based on position
-                    if i == j:  # Diagonal - no change
-                        cell_class = "diagonal"
-                    elif i < j:  # Above diagonal - regression
-                        cell_class = "above-diagonal"
-                    else:  # Below diagonal - improvement
-                        cell_class = "below-diagonal"
-                    
-                    html_content += f'<td class="{cell_class}">{value}</td>'
-                
-                html_content += '</tr>'
-            
-            html_content += """
+                    <tr><td>Goal Hit</td><td>100% and above</td></tr>
+                    <tr><td>Elite</td><td>90% - 99.99%</td></tr>
+                    <tr><td>Above Average</td><td>76% - 90%</td></tr>
+                    <tr><td>Average</td><td>51% - 75%</td></tr>
+                    <tr><td>Under Developed</td><td>26% - 50%</td></tr>
+                    <tr><td>Severely Under Developed</td><td>0% - 25%</td></tr>
                 </tbody>
             </table>
-            """
-        
-        html_content += """
-        <h2>3.2. Acceleration Transitions</h2>
-        
-        <div class="filter-info">
-            <p><strong>Reading Guide:</strong> Rows show starting bracket, columns show ending bracket. 
-            Numbers show count of users who made each transition.</p>
+            
+            <h2>Understanding Transition Analysis</h2>
+            <p>Transition matrices show how users move between development brackets over time:</p>
             <ul>
-                <li><span style="color: #4da6ff; font-weight: bold;">Blue cells</span> show users who remained in the same bracket.</li>
-                <li><span style="color: #ff6b6b; font-weight: bold;">Red cells</span> show regression to lower brackets.</li>
-                <li><span style="color: #4dff4d; font-weight: bold;">Green cells</span> show improvement to higher brackets.</li>
+                <li><strong>Blue cells</strong> - Users who remained in the same bracket</li>
+                <li><strong>Red cells</strong> - Users who regressed to lower brackets</li>
+                <li><strong>Green cells</strong> - Users who improved to higher brackets</li>
             </ul>
-        </div>
-        """
-        
-        # Add acceleration transition matrices with highlighting
-        for period, matrix in accel_transitions.items():
-            html_content += f'<h3>Period: {period}</h3>'
-            
-            # If matrix is a Styler object, get the underlying DataFrame
-            if hasattr(matrix, 'data'):
-                matrix_df = matrix.data
-            else:
-                matrix_df = matrix
-                
-            # Start table
-            html_content += """
-            <table class="table">
-                <thead>
-                    <tr>
-                        <th>From \ To</th>
-            """
             
-            # Add column headers
-            for col in matrix_df.columns:
-                html_content += f'<th>{col}</th>'
+            <h2>Understanding Improvement Thresholds</h2>
+            <p>The improvement threshold is calculated as the average percentage change across all users
+            for a specific body region between consecutive tests. This serves as a reference point
+            to determine which users are underperforming relative to the group average.</p>
             
-            html_content += """
-                    </tr>
-                </thead>
-                <tbody>
-            """
+            <h2>Data Organization</h2>
+            <p>Chronological "test instances" are created for each user by organizing exercises by date:</p>
+            <ul>
+                <li>The first chronological exercise becomes part of Test 1</li>
+                <li>The next exercise becomes part of Test 2, and so on</li>
+                <li>If an exercise is repeated, it occupies the next available test instance</li>
+            </ul>
             
-            # Add rows with appropriate cell highlighting
-            for i, row_idx in enumerate(matrix_df.index):
-                html_content += f'<tr><td>{row_idx}</td>'
-                
-                for j, col in enumerate(matrix_df.columns):
-                    value = matrix_df.iloc[i, j]
-                    # Determine cell color based on position
-                    if i == j:  # Diagonal - no change
-                        cell_class = "diagonal"
-                    elif i < j:  # Above diagonal - regression
-                        cell_class = "above-diagonal"
-                    else:  # Below diagonal - improvement
-                        cell_class = "below-diagonal"
-                    
-                    html_content += f'<td class="{cell_class}">{value}</td>'
-                
-                html_content += '</tr>'
+            <p>This approach allows tracking improvement over time across different exercises.</p>
+            <p>When the minimum days filter is applied:</p>
+            <ol>
+                <li>The first chronological test for each exercise is always included</li>
+                <li>Subsequent tests are only included if they occur at least the specified number of days after the previous test</li>
+                <li>This filtering is done at the raw data level before organizing into test instances</li>
+            </ol>
             
-            html_content += """
-                </tbody>
-            </table>
+            <h2>Exercise Categories and Body Regions</h2>
+            <p>Exercises are organized into the following body regions:</p>
+            <ul>
+                <li><strong>Arms</strong>: Biceps Curl, Triceps Extension</li>
+                <li><strong>Legs</strong>: Lateral Bound, Vertical Jump</li>
+                <li><strong>Press/Pull</strong>: Chest Press, Horizontal Row</li>
+                <li><strong>Torso</strong>: Straight Arm Trunk Rotation, PNF D2 Extension, PNF D2 Flexion, Shot Put</li>
+            </ul>
+        </div>
+        """
+
+# Static fragments of the PDF report, filled in with str.format_map
+_PDF_COVER_TEMPLATE = """
+        <h1>{title}</h1>
+        <p>Generated on {date}</p>
+        """
+
+_PDF_SITE_NAME_TEMPLATE = """
+            <div class="site-name">
+                <h2>{site_name}</h2>
+            </div>
             """
-        html_content += "</div>"
-        
-        html_content += """
-        <h1>4. Body Region Analysis</h1>
-        <div class="section">
-        
-        <h2>Development Score Averages by Body Region</h2>
-        <p>Values represent average development scores (percentage of goal standards).</p>
-        <table class="table">
-            <thead>
-                <tr>
-                    <th>Body Region</th>
-                    <th>Power Test 1</th>
-                    <th>Power Test 2</th>
-                    <th>Power Test 3</th>
-                    <th>Power Test 4</th>
-                    <th>Accel Test 1</th>
-                    <th>Accel Test 2</th>
-                    <th>Accel Test 3</th>
-                    <th>Accel Test 4</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        # Add body region averages data
-        for region, data in body_region_averages.items():
-            html_content += f"<tr><td>{region}</td>"
-            
-            # Add power values
-            for i in range(1, 5):
-                col = f"Power Test {i}"
-                if col in data:
-                    value = data[col]
-                    if pd.isna(value):
-                        html_content += "<td>-</td>"
-                    else:
-                        html_content += f"<td>{value:.2f}%</td>"
-                else:
-                    html_content += "<td>-</td>"
-            
-            # Add acceleration values
-            for i in range(1, 5):
-                col = f"Accel Test {i}"
-                if col in data:
-                    value = data[col]
-                    if pd.isna(value):
-                        html_content += "<td>-</td>"
-                    else:
-                        html_content += f"<td>{value:.2f}%</td>"
-                else:
-                    html_content += "<td>-</td>"
-            
-            html_content += "</tr>"
-        
-        html_content += """
-            </tbody>
-        </table>
+
+_PDF_TOC_TEMPLATE = """
+        <div class="toc">
+            <h2>Table of Contents</h2>
+            <ul>
+                <li>1. Overview</li>
+                <li>2. Group Development Analysis
+                    <ul>
+                        <li>2.1. Single Test Users</li>
+                        <li>2.2. Multi-Test Users</li>
+                    </ul>
+                </li>
+                <li>3. Transition Analysis
+                    <ul>
+                        <li>3.1. Power Transitions</li>
+                        <li>3.2. Acceleration Transitions</li>
+                    </ul>
+                </li>
+                <li>4. Body Region Analysis
+                    <ul>{region_items}
+                    </ul>
+                </li>
+                <li>5. Information Guide</li>
+            </ul>
         </div>
         """
-        
-        # Individual region analysis sections
-        region_counter = 1
-        for region_name in body_region_averages.keys():
-            # Get threshold data for this region
-            region_thresholds = {}
-            if region_name in improvement_thresholds:
-                region_thresholds = improvement_thresholds[region_name]
-            
-            # Format for display, with sensible defaults
-            power_1_to_2 = region_thresholds.get('power_1_to_2', 'N/A')
-            power_2_to_3 = region_thresholds.get('power_2_to_3', 'N/A')
-            accel_1_to_2 = region_thresholds.get('accel_1_to_2', 'N/A')
-            accel_2_to_3 = region_thresholds.get('accel_2_to_3', 'N/A')
-            
-            # Start building content for this region
-            html_content += f"""
+
+_PDF_REGION_HEADER_TEMPLATE = """
             <h2>4.{region_counter}. {region_name} Region Analysis</h2>
             <div class="section">
                 
@@ -989,253 +493,21 @@ class ReportGenerator:
                 <h3>Underperforming Users (Test 1 → Test 2)</h3>
                 <p>These users showed less improvement than the group average for this region.</p>
             """
-            
-            # Extract underperformers lists if available
-            power_underperformers_1_2 = []
-            accel_underperformers_1_2 = []
-            
-            # Check if we have metrics data for this region
-            if region_name in region_metrics and isinstance(region_metrics[region_name], tuple):
-                region_data = region_metrics[region_name]
-                # Check if we have underperformers data at index 7 and 8
-                if len(region_data) > 8:
-                    if isinstance(region_data[7], list):
-                        power_underperformers_1_2 = region_data[7]
-                    if isinstance(region_data[8], list):
-                        accel_underperformers_1_2 = region_data[8]
-            
-            # Create underperformers table for Test 1 → Test 2
-            html_content += """
-                <table class="table">
-                    <thead>
-                        <tr>
-                            <th>User Name</th>
-                            <th>Power</th>
-                            <th>Acceleration</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-            """
-            
-            # Create a set of all users across both power and acceleration
-            all_users = set()
-            power_users = {}
-            accel_users = {}
-            
-            # Extract user names and values
-            for user, change in power_underperformers_1_2:
-                all_users.add(user)
-                power_users[user] = change
-            
-            for user, change in accel_underperformers_1_2:
-                all_users.add(user)
-                accel_users[user] = change
-            
-            # Add rows for each user
-            for user in sorted(all_users):
-                html_content += f"<tr><td>{user}</td>"
-                
-                # Power column - show checkmark and value if user is in power underperformers
-                if user in power_users:
-                    html_content += f"<td>✓ ({power_users[user]:.2f}%)</td>"
-                else:
-                    html_content += "<td></td>"
-                
-                # Acceleration column - show checkmark and value if user is in acceleration underperformers
-                if user in accel_users:
-                    html_content += f"<td>✓ ({accel_users[user]:.2f}%)</td>"
-                else:
-                    html_content += "<td></td>"
-                
-                html_content += "</tr>"
-            
-            # If no underperformers, show empty message
-            if not all_users:
-                html_content += "<tr><td colspan='3' style='text-align: center;'>No underperforming users identified.</td></tr>"
-            
-            html_content += """
-                    </tbody>
-                </table>
-                
+
+# Heading of the Test 2 → Test 3 underperformer table on a PDF region page
+_PDF_UNDERPERFORMERS_2_3_HEADING = """
                 <h3>Underperforming Users (Test 2 → Test 3)</h3>
                 <p>These users showed less improvement than the group average for this region.</p>
             """
-            
-            # Extract underperformers lists for Test 2 → Test 3
-            power_underperformers_2_3 = []
-            accel_underperformers_2_3 = []
-            
-            # Check if we have metrics data for this region with test 2-3 underperformers
-            if region_name in region_metrics and isinstance(region_metrics[region_name], tuple):
-                region_data = region_metrics[region_name]
-                # Check if we have underperformers data at index 9 and 10
-                if len(region_data) > 10:
-                    if isinstance(region_data[9], list):
-                        power_underperformers_2_3 = region_data[9]
-                    if isinstance(region_data[10], list):
-                        accel_underperformers_2_3 = region_data[10]
-            
-            # Create underperformers table for Test 2 → Test 3
-            html_content += """
-                <table class="table">
-                    <thead>
-                        <tr>
-                            <th>User Name</th>
-                            <th>Power</th>
-                            <th>Acceleration</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-            """
-            
-            # Create a set of all users across both power and acceleration
-            all_users = set()
-            power_users = {}
-            accel_users = {}
-            
-            # Extract user names and values
-            for user, change in power_underperformers_2_3:
-                all_users.add(user)
-                power_users[user] = change
-            
-            for user, change in accel_underperformers_2_3:
-                all_users.add(user)
-                accel_users[user] = change
-            
-            # Add rows for each user
-            for user in sorted(all_users):
-                html_content += f"<tr><td>{user}</td>"
-                
-                # Power column - show checkmark and value if user is in power underperformers
-                if user in power_users:
-                    html_content += f"<td>✓ ({power_users[user]:.2f}%)</td>"
-                else:
-                    html_content += "<td></td>"
-                
-                # Acceleration column - show checkmark and value if user is in acceleration underperformers
-                if user in accel_users:
-                    html_content += f"<td>✓ ({accel_users[user]:.2f}%)</td>"
-                else:
-                    html_content += "<td></td>"
-                
-                html_content += "</tr>"
-            
-            # If no underperformers, show empty message
-            if not all_users:
-                html_content += "<tr><td colspan='3' style='text-align: center;'>No underperforming users identified.</td></tr>"
-            
-            html_content += """
-                    </tbody>
-                </table>
+
+# Closes a PDF region page opened by _PDF_REGION_HEADER_TEMPLATE
+_PDF_REGION_CLOSE = """
             </div>
             """
-            region_counter += 1
-        
-        # Information Guide
-        html_content += """
-        <h1>5. Information Guide</h1>
-        <div class="section">
-            
-            <h2>Understanding Development Scores</h2>
-            <p>Development scores are calculated as a percentage of goal standards for each exercise:</p>
-            <p><strong>Development Score = (User's value / Goal standard) × 100</strong></p>
-            
-            <h3>Development Brackets</h3>
-            <table class="table">
-                <thead>
-                    <tr>
-                        <th>Bracket</th>
-                        <th>Score Range</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr><td>Goal Hit</td><td>100% and above</td></tr>
-                    <tr><td>Elite</td><td>90% - 99.99%</td></tr>
-                    <tr><td>Above Average</td><td>76% - 90%</td></tr>
-                    <tr><td>Average</td><td>51% - 75%</td></tr>
-                    <tr><td>Under Developed</td><td>26% - 50%</td></tr>
-                    <tr><td>Severely Under Developed</td><td>0% - 25%</td></tr>
-                </tbody>
-            </table>
-            
-            <h2>Understanding Transition Analysis</h2>
-            <p>Transition matrices show how users move between development brackets over time:</p>
-            <ul>
-                <li><strong>Blue cells</strong> - Users who remained in the same bracket</li>
-                <li><strong>Red cells</strong> - Users who regressed to lower brackets</li>
-                <li><strong>Green cells</strong> - Users who improved to higher brackets</li>
-            </ul>
-            
-            <h2>Understanding Improvement Thresholds</h2>
-            <p>The improvement threshold is calculated as the average percentage change across all users
-            for a specific body region between consecutive tests. This serves as a reference point
-            to determine which users are underperforming relative to the group average.</p>
-            
-            <h2>Data Organization</h2>
-            <p>Chronological "test instances" are created for each user by organizing exercises by date:</p>
-            <ul>
-                <li>The first chronological exercise becomes part of Test 1</li>
-                <li>The next exercise becomes part of Test 2, and so on</li>
-                <li>If an exercise is repeated, it occupies the next available test instance</li>
-            </ul>
-            
-            <p>This approach allows tracking improvement over time across different exercises.</p>
-            <p>When the minimum days filter is applied:</p>
-            <ol>
-                <li>The first chronological test for each exercise is always included</li>
-                <li>Subsequent tests are only included if they occur at least the specified number of days after the previous test</li>
-                <li>This filtering is done at the raw data level before organizing into test instances</li>
-            </ol>
-            
-            <h2>Exercise Categories and Body Regions</h2>
-            <p>Exercises are organized into the following body regions:</p>
-            <ul>
-                <li><strong>Arms</strong>: Biceps Curl, Triceps Extension</li>
-                <li><strong>Legs</strong>: Lateral Bound, Vertical Jump</li>
-                <li><strong>Press/Pull</strong>: Chest Press, Horizontal Row</li>
-                <li><strong>Torso</strong>: Straight Arm Trunk Rotation, PNF D2 Extension, PNF D2 Flexion, Shot Put</li>
-            </ul>
-        </div>
-        """
-        
-        # Close the HTML document
-        html_content += """
-        </body>
-        </html>
-        """
-        
-        # Convert HTML to PDF with specific page settings
-        pdf_buffer = io.BytesIO()
-        HTML(string=html_content).write_pdf(
-            pdf_buffer,
-            presentational_hints=True
-        )
-        pdf_buffer.seek(0)
-        
-        return pdf_buffer.getvalue()
-        
-    def _generate_comprehensive_html(self, power_counts, accel_counts, power_transitions, accel_transitions,
-                                   body_region_averages, improvement_thresholds, region_metrics, site_name="",
-                                   single_test_distribution=None):
-        """
-        Generate comprehensive HTML report content with separate pages.
-        
-        Args:
-            power_counts (DataFrame): Power development distribution
-            accel_counts (DataFrame): Acceleration development distribution
-            power_transitions (dict): Dictionary of power transition matrices by period
-            accel_transitions (dict): Dictionary of acceleration transition matrices by period
-            body_region_averages (dict): Dictionary of body region averages
-            improvement_thresholds (dict): Dictionary of improvement thresholds by region
-            region_metrics (dict): Dictionary of region metrics including underperformers
-            site_name (str, optional): Name of the site/location for the report header
-            single_test_distribution (DataFrame, optional): Distribution data for single test users
-            
-        Returns:
-            str: HTML content
-        """
-        # Create CSS styles
-        css_styles = """
+
+
+# Screen stylesheet, page shell and static pages of the interactive HTML report
+_HTML_CSS_STYLES = _dedent_html("""
         <style>
             body {
                 font-family: Arial, sans-serif;
@@ -1388,77 +660,1400 @@ class ReportGenerator:
                 background-color: #ffeeee;
                 border-left: 3px solid #ff6b6b;
             }
-        </style>
+        </style>
+        """)
+
+_HTML_HEAD_TEMPLATE = _dedent_html("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>{title}</title>
+            {css_styles}
+            <script>
+                function goToPage(pageId) {{
+                    document.querySelectorAll('.page').forEach(page => {{
+                        page.style.display = 'none';
+                    }});
+                    document.getElementById(pageId).style.display = 'block';
+                }}
+            </script>
+        </head>
+        <body>
+            <div class="nav">
+                <a href="#" onclick="goToPage('overview'); return false;">Overview</a>
+                <a href="#" onclick="goToPage('group-development'); return false;">Group Development</a>
+                <a href="#" onclick="goToPage('power-transitions'); return false;">Power Transitions</a>
+                <a href="#" onclick="goToPage('accel-transitions'); return false;">Acceleration Transitions</a>
+        """)
+
+_HTML_TRANSITIONS_PAGE_HEADER_TEMPLATE = _dedent_html("""
+        <div id="{page_id}" class="page" style="display: none;">
+            <div class="container">
+                <h1>{title}</h1>
+        """)
+
+_HTML_REGION_HEADER_TEMPLATE = _dedent_html("""
+            <div id="{region_id}" class="page" style="display: none;">
+                <div class="container">
+                    <h1>{region_name} Region Analysis</h1>
+                    
+                    <h2>Group Averages</h2>
+            """)
+
+# Closes a page of the interactive report and its container
+_HTML_PAGE_CLOSE = _dedent_html("""
+            </div>
+        </div>
+        """)
+
+_HTML_INFORMATION_PAGE = _dedent_html("""
+        <div id="information" class="page" style="display: none;">
+            <div class="container">
+                <h1>Information and Reading Guide</h1>
+                
+                <h2>Development Score Calculation</h2>
+                <p>Development scores are calculated as a percentage of goal standards for each exercise:</p>
+                <pre>Development Score = (User's value / Goal standard) × 100</pre>
+                
+                <h3>Development Brackets</h3>
+                <p>Development scores are categorized into the following brackets:</p>
+                <table class="table">
+                    <thead>
+                        <tr>
+                            <th>Bracket</th>
+                            <th>Score Range</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr><td>Goal Hit</td><td>100% and above</td></tr>
+                        <tr><td>Elite</td><td>90% - 99.99%</td></tr>
+                        <tr><td>Above Average</td><td>76% - 90%</td></tr>
+                        <tr><td>Average</td><td>51% - 75%</td></tr>
+                        <tr><td>Under Developed</td><td>26% - 50%</td></tr>
+                        <tr><td>Severely Under Developed</td><td>0% - 25%</td></tr>
+                    </tbody>
+                </table>
+                
+                <h2>Data Organization</h2>
+                
+                <h3>Test Instances</h3>
+                <p>Chronological "test instances" are created for each user by organizing exercises by date:</p>
+                <ul>
+                    <li>The first chronological exercise becomes part of Test 1</li>
+                    <li>The next exercise becomes part of Test 2, and so on</li>
+                    <li>If an exercise is repeated, it occupies the next available test instance</li>
+                </ul>
+                <p>This approach allows tracking improvement over time across different exercises.</p>
+                
+                <h3>Improvement Threshold</h3>
+                <p>The improvement threshold is calculated as the average percentage change across all users
+                for a specific body region between consecutive tests. This serves as a reference point
+                to determine which users are underperforming relative to the group average.</p>
+                
+                <h3>Minimum Days Between Tests</h3>
+                <p>When the minimum days filter is applied:</p>
+                <ol>
+                    <li>The first chronological test for each exercise is always included</li>
+                    <li>Subsequent tests are only included if they occur at least the specified number of days after the previous test</li>
+                    <li>This filtering is done at the raw data level before organizing into test instances</li>
+                </ol>
+                
+                <h2>Color Coding Guide</h2>
+                
+                <h3>Transition Matrix Colors</h3>
+                <ul>
+                    <li><span style="color: #4da6ff; font-weight: bold;">Blue cells</span> show users who remained in the same bracket.</li>
+                    <li><span style="color: #ff6b6b; font-weight: bold;">Red cells</span> show regression to lower brackets.</li>
+                    <li><span style="color: #4dff4d; font-weight: bold;">Green cells</span> show improvement to higher brackets.</li>
+                </ul>
+                
+                <h3>Value Colors</h3>
+                <ul>
+                    <li><span class="positive">Green values</span> indicate positive changes or improvements.</li>
+                    <li><span class="negative">Red values</span> indicate negative changes or regressions.</li>
+                </ul>
+                
+                <h2>Filtering Information</h2>
+                
+                <h3>Resistance Standardization</h3>
+                <p>When enabled, only includes data where exercises were performed at standard resistance values.
+                A small tolerance (±0.5 lbs) is allowed to account for minor variations.</p>
+                
+                <h3>Evaluation Window</h3>
+                <p>Filters data to a specific date range, allowing focus on particular testing periods.</p>
+                
+                <h3>Minimum Days Between Tests</h3>
+                <p>Ensures tests for the same exercise are separated by at least the specified number of days.
+                This helps prevent including tests that are too close together, which might not reflect
+                meaningful physiological changes.</p>
+            </div>
+        </div>
+        """)
+
+# Closes the content div and the document of the interactive report
+_HTML_FOOTER = _dedent_html("""
+            </div>
+        </body>
+        </html>
+        """)
+
+
+# Stylesheet and page shell of the distribution report
+_DISTRIBUTION_CSS_STYLES = """
+        <style>
+            body {
+                font-family: Arial, sans-serif;
+                margin: 20px;
+                padding: 0;
+                color: #333;
+            }
+            h1, h2, h3, h4 {
+                color: #2c3e50;
+            }
+            .container {
+                max-width: 1200px;
+                margin: 0 auto;
+            }
+            .table {
+                border-collapse: collapse;
+                margin: 25px 0;
+                font-size: 0.9em;
+                width: 100%;
+                box-shadow: 0 0 20px rgba(0, 0, 0, 0.15);
+            }
+            .table thead tr {
+                background-color: #2c3e50;
+                color: #ffffff;
+                text-align: left;
+            }
+            .table th,
+            .table td {
+                padding: 12px 15px;
+            }
+            .table tbody tr {
+                border-bottom: 1px solid #dddddd;
+            }
+            .table tbody tr:nth-of-type(even) {
+                background-color: #f3f3f3;
+            }
+            .table tbody tr:last-of-type {
+                border-bottom: 2px solid #2c3e50;
+            }
+            .chart-container {
+                width: 100%;
+                margin: 25px 0;
+            }
+            /* Transition table cell colors */
+            .diagonal {
+                background-color: #d4e6f1 !important; /* Pale Blue for no change */
+            }
+            .above-diagonal {
+                background-color: #f5b7b1 !important; /* Pale Red for regression */
+            }
+            .below-diagonal {
+                background-color: #abebc6 !important; /* Pale Green for improvement */
+            }
+        </style>
+        """
+
+_DISTRIBUTION_REPORT_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Exercise Development Distribution Report</title>
+            {css_styles}
+        </head>
+        <body>
+            <div class="container">
+                <h1>Exercise Development Distribution Report</h1>
+                
+                <h2>Power Development Distribution</h2>
+                {power_table}
+                
+                <h2>Acceleration Development Distribution</h2>
+                {accel_table}
+                
+                {transitions_html}
+            </div>
+        </body>
+        </html>
+        """
+
+
+def _escape_labels(labels):
+    """
+    HTML-escape a sequence of row/column labels once for reuse in a table.
+
+    Args:
+        labels (iterable): Index or column labels
+
+    Returns:
+        list: Escaped label strings in the same order
+    """
+    return [html.escape(str(label)) for label in labels]
+
+
+def _unwrap_transitions(transitions):
+    """
+    Replace any Styler transition matrices with their underlying DataFrames.
+
+    Args:
+        transitions (dict): Transition matrices (DataFrame or Styler) by period
+
+    Returns:
+        dict: Transition DataFrames by period, or None if no transitions were given
+    """
+    if transitions is None:
+        return None
+    return {
+        period: matrix.data if isinstance(matrix, Styler) else matrix
+        for period, matrix in transitions.items()
+    }
+
+
+@functools.lru_cache(maxsize=16)
+def _transition_cell_codes(n_rows, n_cols):
+    """
+    Classify every cell of a transition matrix by its position.
+
+    Args:
+        n_rows (int): Number of rows (starting brackets)
+        n_cols (int): Number of columns (ending brackets)
+
+    Returns:
+        ndarray: int8 array of shape (n_rows, n_cols) with 0 on the diagonal
+            (no change), 1 above it (regression) and 2 below it (improvement)
+    """
+    rows, cols = np.indices((n_rows, n_cols))
+    codes = np.where(rows == cols, 0, np.where(rows < cols, 1, 2)).astype(np.int8)
+    # The array is shared between callers through the cache
+    codes.flags.writeable = False
+    return codes
+
+
+@functools.lru_cache(maxsize=16)
+def _transition_cell_classes(n_rows, n_cols):
+    """
+    Precompute the CSS class of every cell of a transition matrix.
+
+    Args:
+        n_rows (int): Number of rows (starting brackets)
+        n_cols (int): Number of columns (ending brackets)
+
+    Returns:
+        tuple: One tuple of CSS class names per row
+    """
+    # Map the codes to names with one fancy-indexing pass over the whole grid
+    names = np.array(_TRANSITION_CELL_CLASSES)[_transition_cell_codes(n_rows, n_cols)]
+    return tuple(map(tuple, names.tolist()))
+
+
+def _test_columns(counts):
+    """
+    List the per-test columns ("Test 1", "Test 2", ...) of a count table.
+
+    The power and acceleration count tables share their columns, so the
+    list taken from the power table is used for both.
+
+    Args:
+        counts (DataFrame): Development distribution counts
+
+    Returns:
+        list: Test column names in table order
+    """
+    return [col for col in counts.columns if col.startswith('Test')]
+
+
+def _render_multi_test_table(counts, test_columns):
+    """
+    Render a multi-test development distribution table.
+
+    Args:
+        counts (DataFrame): Distribution counts with categories as the index
+        test_columns (list): Test columns to include, in display order
+
+    Returns:
+        str: HTML table with missing values shown as 0
+    """
+    table = counts[test_columns]
+    # Missing cells are found with one vectorised isna over the whole table
+    values = table.to_numpy(dtype=object).tolist()
+    missing = table.isna().to_numpy().tolist()
+    rows = [
+        (category, ["0" if is_missing else value for value, is_missing in zip(row_values, row_missing)])
+        for category, row_values, row_missing in zip(counts.index, values, missing)
+    ]
+    return _MULTI_TEST_TABLE_TEMPLATE.render(columns=test_columns, rows=rows)
+
+
+def _render_single_test_rows(single_test_distribution):
+    """
+    Render the rows of the single test users distribution table.
+
+    Args:
+        single_test_distribution (DataFrame): Counts by category with Power
+            and Acceleration columns
+
+    Returns:
+        str: HTML table rows, with missing columns or counts shown as 0
+    """
+    # Both columns are read as one integer array instead of per-cell lookups
+    counts = (
+        single_test_distribution.reindex(columns=["Power", "Acceleration"]).fillna(0).to_numpy(dtype='int64').tolist()
+    )
+    rows = (
+        (category, power_value, accel_value)
+        for category, (power_value, accel_value) in zip(single_test_distribution.index, counts)
+    )
+    return _SINGLE_TEST_ROWS_TEMPLATE.render(rows=rows)
+
+
+def _change_class(value):
+    """
+    Pick the CSS class colouring a percentage change.
+
+    Args:
+        value (float): Change in percent
+
+    Returns:
+        str: "positive" for zero or above, "negative" otherwise
+    """
+    return _POSITIVE_CLASS if value >= 0 else _NEGATIVE_CLASS
+
+
+def _change_labels(changes, placeholders):
+    """
+    Format the average changes shown in a report's metric boxes.
+
+    Args:
+        changes (tuple): Average changes in percent for Test 1→2, 2→3 and
+            3→4, or None when they were not supplied
+        placeholders (tuple): Labels to show when changes is None
+
+    Returns:
+        tuple: Signed one-decimal labels, as shown in the app
+    """
+    if changes is None:
+        return placeholders
+    return tuple(f"{value:+.1f}" for value in changes)
+
+
+def _render_change_metrics(change_label, labels):
+    """
+    Render the average change metric boxes of one multi-test distribution.
+
+    Args:
+        change_label (str): Label prefix for the boxes, e.g. "Power Change"
+        labels (tuple): Change labels for Test 1→2, 2→3 and 3→4, as returned
+            by _change_labels
+
+    Returns:
+        str: HTML metric row
+    """
+    return _CHANGE_METRICS_TEMPLATE.render(change_label=change_label, labels=labels)
+
+
+def _render_change_underperformers(title, changes, key):
+    """
+    Render one metric's underperformer table for a region page.
+
+    Args:
+        title (str): Table heading
+        changes (dict): Change metrics for the metric, or None
+        key (str): Entry of changes holding the (user, change) tuples
+
+    Returns:
+        str: HTML heading and table, or an empty string when there are no
+            underperformers
+    """
+    if not isinstance(changes, dict) or not changes.get(key):
+        return ""
+    users, values = zip(*changes[key])
+    # Classes and two-decimal labels are produced for the whole list at once
+    values = np.asarray(values, dtype=float)
+    classes = np.where(values >= 0, _POSITIVE_CLASS, _NEGATIVE_CLASS)
+    labels = np.char.mod("%.2f", values)
+    rows = zip(users, classes.tolist(), labels.tolist())
+    return _CHANGE_UNDERPERFORMERS_TEMPLATE.render(title=title, rows=rows)
+
+
+def _render_lowest_change(power_exercise, power_value, accel_exercise, accel_value):
+    """
+    Render the lowest-change exercises table for a region page.
+
+    Args:
+        power_exercise (str): Exercise with the lowest power change, or None
+        power_value (float): Its power change in percent, or None
+        accel_exercise (str): Exercise with the lowest acceleration change, or None
+        accel_value (float): Its acceleration change in percent, or None
+
+    Returns:
+        str: HTML heading and table; metrics without data are left out
+    """
+    rows = [
+        (metric, exercise, _change_class(value), f"{value:.2f}")
+        for metric, exercise, value in (
+            ('Power', power_exercise, power_value),
+            ('Acceleration', accel_exercise, accel_value),
+        )
+        if exercise and value is not None
+    ]
+    return _LOWEST_CHANGE_TEMPLATE.render(rows=rows)
+
+
+def _render_percent_table(df):
+    """
+    Render a numeric DataFrame as a table of two-decimal percentages.
+
+    Hand-built rather than going through Styler, which sets up a full
+    template and style context even when no styles are applied.
+
+    Args:
+        df (DataFrame): Percentage values with row and column labels
+
+    Returns:
+        str: HTML table
+    """
+    corner = "" if df.index.name is None else df.index.name
+    # Every cell is formatted in a single pass over the value array
+    cells = np.char.mod("%.2f", df.to_numpy(dtype=float)).tolist()
+    return _PERCENT_TABLE_TEMPLATE.render(corner=corner, columns=df.columns, rows=zip(df.index, cells))
+
+
+def _render_threshold_cell(value):
+    """
+    Render one improvement threshold as a colour-coded table cell.
+
+    Args:
+        value (float): Threshold percentage, or None/NaN if unavailable
+
+    Returns:
+        str: HTML table cell
+    """
+    # NaN is the only value not equal to itself, which is cheaper than pd.isna
+    if value is None or value != value:
+        return '<td>Not enough data</td>'
+    return f'<td class="{_change_class(value)}">{value:.2f}%</td>'
+
+
+def _render_transition_table(matrix_df):
+    """
+    Render a transition matrix as a highlighted HTML table.
+
+    Cell classes come from the cached diagonal/above/below grid, so no cell
+    is classified while rendering.
+
+    Args:
+        matrix_df (DataFrame): Transition matrix
+
+    Returns:
+        str: HTML table, or a short note when the matrix is empty
+    """
+    if matrix_df.empty:
+        return "<p>No transitions recorded for this period.</p>"
+    cell_classes = _transition_cell_classes(*matrix_df.shape)
+    # One conversion to nested Python lists, so no per-cell NumPy scalar boxing
+    values = matrix_df.to_numpy().tolist()
+    rows = (
+        (label, zip(row_classes, row_values))
+        for label, row_classes, row_values in zip(matrix_df.index, cell_classes, values)
+    )
+    return _TRANSITION_TABLE_TEMPLATE.render(columns=matrix_df.columns, rows=rows)
+
+
+def _extract_underperformers(region_data):
+    """
+    Pull the underperformer lists out of a region's metrics tuple.
+
+    Entries 7 and 8 hold the Test 1 → Test 2 power and acceleration lists,
+    entries 9 and 10 the Test 2 → Test 3 ones.
+
+    Args:
+        region_data (tuple): Region metrics, or None if the region has none
+
+    Returns:
+        tuple: (power_1_2, accel_1_2, power_2_3, accel_2_3) lists, each empty
+            when not available
+    """
+    if not isinstance(region_data, tuple):
+        return [], [], [], []
+
+    def _list_at(index, min_length):
+        if len(region_data) > min_length and isinstance(region_data[index], list):
+            return region_data[index]
+        return []
+
+    return _list_at(7, 8), _list_at(8, 8), _list_at(9, 10), _list_at(10, 10)
+
+
+def _render_underperformer_table(power_underperformers, accel_underperformers):
+    """
+    Render the combined power/acceleration underperformer table for one period.
+
+    Users from both lists get a single row each, sorted by name.
+
+    Args:
+        power_underperformers (list): (user, change) tuples for power
+        accel_underperformers (list): (user, change) tuples for acceleration
+
+    Returns:
+        str: HTML table, with a placeholder row if both lists are empty
+    """
+    # A user listed twice keeps their last change value
+    power = dict(power_underperformers)
+    accel = dict(accel_underperformers)
+    rows = [
+        (
+            user,
+            f"✓ ({power[user]:.2f}%)" if user in power else "",
+            f"✓ ({accel[user]:.2f}%)" if user in accel else "",
+        )
+        for user in sorted(power.keys() | accel.keys())
+    ]
+    return _UNDERPERFORMER_TABLE_TEMPLATE.render(rows=rows)
+
+
+@st.cache_data(show_spinner=False, max_entries=_REPORT_CACHE_MAX_ENTRIES, ttl=_REPORT_CACHE_TTL)
+def _cached_html_report(power_counts, accel_counts, power_transitions, accel_transitions):
+    """Build the distribution HTML report once per distinct set of inputs, stored encoded."""
+    return ReportGenerator()._build_html_report(
+        power_counts, accel_counts, power_transitions, accel_transitions
+    ).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False, max_entries=_REPORT_CACHE_MAX_ENTRIES, ttl=_REPORT_CACHE_TTL)
+def _cached_comprehensive_html(power_counts, accel_counts, power_transitions, accel_transitions,
+                               body_region_averages, improvement_thresholds, region_metrics,
+                               site_name, single_test_distribution, avg_power_changes, avg_accel_changes):
+    """Build the comprehensive HTML report once per distinct set of inputs, stored encoded."""
+    return ReportGenerator()._build_comprehensive_html(
+        power_counts, accel_counts, power_transitions, accel_transitions,
+        body_region_averages, improvement_thresholds, region_metrics, site_name,
+        single_test_distribution, avg_power_changes=avg_power_changes, avg_accel_changes=avg_accel_changes
+    ).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False, max_entries=_REPORT_CACHE_MAX_ENTRIES)
+def _cached_comprehensive_pdf(power_counts, accel_counts, power_transitions, accel_transitions,
+                              body_region_averages, improvement_thresholds, region_metrics,
+                              site_name, single_test_distribution, report_date,
+                              avg_power_changes, avg_accel_changes):
+    """Render the comprehensive PDF report once per distinct set of inputs and generation date."""
+    return ReportGenerator()._build_comprehensive_pdf_report(
+        power_counts, accel_counts, power_transitions, accel_transitions,
+        body_region_averages, improvement_thresholds, region_metrics, site_name,
+        single_test_distribution, report_date, avg_power_changes, avg_accel_changes
+    )
+
+
+class ReportGenerator:
+    """Generates reports for exercise data analysis."""
+    
+    # The generator is stateless, so instances carry no __dict__
+    __slots__ = ()
+    
+    def __init__(self):
+        """Initialize the report generator with default settings."""
+        pass
+    
+    def generate_distribution_report(self, power_counts, accel_counts):
+        """
+        Generate a report with distribution tables and a bar chart visualization.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution counts
+            accel_counts (DataFrame): Acceleration development distribution counts
+            
+        Returns:
+            bytes: PDF report as bytes
+        """
+        # The cache stores the report encoded, so callers don't re-encode it; each hit is still a fresh unpickled copy
+        return self._generate_html_report(power_counts, accel_counts)
+    
+    def create_distribution_chart(self, power_counts, accel_counts):
+        """
+        Create a bar chart visualization for distribution data.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            
+        Returns:
+            plotly.graph_objects.Figure: Plotly figure object
+        """
+        # Plotly is only needed for the chart, so keep it out of module import time
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
+        # Extract categories and test values
+        categories = power_counts.index.to_numpy()
+        
+        # Set up the data for plotting
+        test_columns = [col for col in power_counts.columns if 'Test' in col]
+        
+        # Build every bar up front: power bars first, then acceleration
+        traces = [
+            go.Bar(
+                x=categories,
+                y=counts[col].to_numpy(),
+                name=f"{label} {col}",
+                marker_color=color,
+                opacity=0.7,
+                showlegend=True
+            )
+            for counts, label, color in ((power_counts, "Power", 'blue'), (accel_counts, "Acceleration", 'green'))
+            for col in test_columns
+        ]
+        
+        # Create a figure with a single subplot for both power and acceleration,
+        # adding the bars in one call so Plotly validates the data once
+        fig = make_subplots(rows=1, cols=1)
+        fig.add_traces(traces)
+        
+        # Update layout
+        fig.update_layout(
+            title="Distribution of Users by Development Category",
+            xaxis_title="Development Category",
+            yaxis_title="Number of Users",
+            barmode='group',
+            bargap=0.15,
+            bargroupgap=0.1,
+            height=500,
+            width=800,
+            legend=dict(
+                x=0.01,
+                y=0.99,
+                bgcolor='rgba(255, 255, 255, 0.5)',
+                bordercolor='rgba(0, 0, 0, 0.1)',
+                borderwidth=1
+            )
+        )
+        
+        return fig
+    
+    def _generate_html_report(self, power_counts, accel_counts, power_transitions=None, accel_transitions=None):
+        """
+        Generate HTML report content, reusing the cached result for unchanged inputs.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            power_transitions (dict): Dictionary of power transition matrices by period
+            accel_transitions (dict): Dictionary of acceleration transition matrices by period
+            
+        Returns:
+            bytes: UTF-8 encoded HTML content
+        """
+        # Styler objects cannot be hashed, so hand the cache plain DataFrames
+        return _cached_html_report(
+            power_counts, accel_counts,
+            _unwrap_transitions(power_transitions), _unwrap_transitions(accel_transitions)
+        )
+    
+    def _build_html_report(self, power_counts, accel_counts, power_transitions=None, accel_transitions=None):
+        """
+        Generate HTML report content.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            power_transitions (dict): Dictionary of power transition matrices by period
+            accel_transitions (dict): Dictionary of acceleration transition matrices by period
+            
+        Returns:
+            str: HTML content
+        """
+        # No distribution chart visualization
+        chart_html = ""  # Empty string since we're not using the chart
+        
+        # Convert dataframes to HTML tables
+        power_table = power_counts.to_html(classes='table table-striped', index=True)
+        accel_table = accel_counts.to_html(classes='table table-striped', index=True)
+        
+        # Generate transition tables HTML if provided
+        transitions_html = ""
+        if power_transitions and accel_transitions:
+            transitions_html = "".join((
+                """
+            <h2>Transition Analysis</h2>
+            <p>Reading guide: Rows show starting bracket, columns show ending bracket. Numbers show how many users made each transition.</p>
+            """,
+                # Power transitions
+                "<h3>Power Transitions</h3>",
+                self._render_transition_periods(power_transitions),
+                # Acceleration transitions
+                "<h3>Acceleration Transitions</h3>",
+                self._render_transition_periods(accel_transitions),
+            ))
+        
+        # Create HTML content
+        html_content = _DISTRIBUTION_REPORT_TEMPLATE.format_map({
+            'css_styles': _DISTRIBUTION_CSS_STYLES,
+            'power_table': power_table,
+            'accel_table': accel_table,
+            'transitions_html': transitions_html,
+        })
+        
+        return html_content
+    
+    def _render_transition_periods(self, transitions):
+        """
+        Render every period of a set of transition matrices under its own heading.
+        
+        Args:
+            transitions (dict): Transition DataFrames by period, already unwrapped by the caller
+            
+        Returns:
+            str: HTML headings and tables
+        """
+        return "".join(
+            f"<h4>Period: {period}</h4>{_render_transition_table(matrix_df)}"
+            for period, matrix_df in transitions.items()
+        )
+    
+    def generate_downloadable_html(self, power_counts, accel_counts, power_transitions=None, accel_transitions=None):
+        """
+        Generate downloadable HTML report.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            power_transitions (dict): Dictionary of power transition matrices by period
+            accel_transitions (dict): Dictionary of acceleration transition matrices by period
+            
+        Returns:
+            bytes: HTML report as bytes
+        """
+        return self._generate_html_report(power_counts, accel_counts, power_transitions, accel_transitions)
+        
+    def generate_comprehensive_report(self, power_counts, accel_counts, power_transitions, accel_transitions,
+                                    body_region_averages, improvement_thresholds, region_metrics, 
+                                    site_name="", single_test_distribution=None, out=None,
+                                    avg_power_changes=None, avg_accel_changes=None):
+        """
+        Generate a comprehensive HTML report with separate pages for each section.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            power_transitions (dict): Dictionary of power transition matrices by period
+            accel_transitions (dict): Dictionary of acceleration transition matrices by period
+            body_region_averages (dict): Dictionary of body region averages
+            improvement_thresholds (dict): Dictionary of improvement thresholds by region
+            region_metrics (dict): Dictionary of region metrics including underperformers
+            site_name (str, optional): Name of the site/location for the report header
+            single_test_distribution (DataFrame, optional): Distribution data for single test users
+            out (file-like, optional): Text stream to write the report to instead of returning it
+            avg_power_changes (tuple, optional): Average power change in percent for Test 1→2, 2→3 and 3→4
+            avg_accel_changes (tuple, optional): Average acceleration change in percent for Test 1→2, 2→3 and 3→4
+            
+        Returns:
+            bytes: Comprehensive HTML report as bytes, or None if it was written to out
+        """
+        if out is not None:
+            # Stream the pages as they are built; the whole document is never held
+            # in memory, so this path bypasses the report cache
+            self._build_comprehensive_html(
+                power_counts, accel_counts,
+                _unwrap_transitions(power_transitions), _unwrap_transitions(accel_transitions),
+                body_region_averages, improvement_thresholds, region_metrics, site_name,
+                single_test_distribution, out=out,
+                avg_power_changes=avg_power_changes, avg_accel_changes=avg_accel_changes
+            )
+            return None
+        
+        # The cache stores the report encoded, so callers don't re-encode it; each hit is still a fresh unpickled copy
+        return self._generate_comprehensive_html(
+            power_counts, accel_counts, power_transitions, accel_transitions,
+            body_region_averages, improvement_thresholds, region_metrics, site_name,
+            single_test_distribution, avg_power_changes, avg_accel_changes
+        )
+        
+    def generate_comprehensive_pdf_report(self, power_counts, accel_counts, power_transitions, accel_transitions,
+                                         body_region_averages, improvement_thresholds, region_metrics, 
+                                         site_name="", single_test_distribution=None,
+                                         avg_power_changes=None, avg_accel_changes=None):
+        """
+        Generate a comprehensive PDF report from the HTML report.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            power_transitions (dict): Dictionary of power transition matrices by period
+            accel_transitions (dict): Dictionary of power transition matrices by period
+            body_region_averages (dict): Dictionary of body region averages
+            improvement_thresholds (dict): Dictionary of improvement thresholds by region
+            region_metrics (dict): Dictionary of region metrics including underperformers
+            site_name (str, optional): Name of the site/location for the report header
+            single_test_distribution (DataFrame, optional): Distribution data for single test users
+            avg_power_changes (tuple, optional): Average power change in percent for Test 1→2, 2→3 and 3→4
+            avg_accel_changes (tuple, optional): Average acceleration change in percent for Test 1→2, 2→3 and 3→4
+            
+        Returns:
+            bytes: Comprehensive PDF report as bytes
+        """
+        # WeasyPrint dominates the cost, so identical inputs reuse the cached bytes; the
+        # generation date is part of the key so a cached PDF never shows an earlier day
+        return _cached_comprehensive_pdf(
+            power_counts, accel_counts,
+            _unwrap_transitions(power_transitions), _unwrap_transitions(accel_transitions),
+            body_region_averages, improvement_thresholds, region_metrics, site_name,
+            single_test_distribution, pd.Timestamp.now().strftime('%B %d, %Y'),
+            avg_power_changes, avg_accel_changes
+        )
+    
+    def _build_comprehensive_pdf_report(self, power_counts, accel_counts, power_transitions, accel_transitions,
+                                       body_region_averages, improvement_thresholds, region_metrics, 
+                                       site_name="", single_test_distribution=None, report_date=None,
+                                       avg_power_changes=None, avg_accel_changes=None):
+        """
+        Generate a comprehensive PDF report from the HTML report.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            power_transitions (dict): Dictionary of power transition DataFrames by period
+            accel_transitions (dict): Dictionary of acceleration transition DataFrames by period
+            body_region_averages (dict): Dictionary of body region averages
+            improvement_thresholds (dict): Dictionary of improvement thresholds by region
+            region_metrics (dict): Dictionary of region metrics including underperformers
+            site_name (str, optional): Name of the site/location for the report header
+            single_test_distribution (DataFrame, optional): Distribution data for single test users
+            report_date (str, optional): Generation date shown on the cover, today if omitted
+            avg_power_changes (tuple, optional): Average power change in percent for Test 1→2, 2→3
+                and 3→4; placeholders are shown if omitted
+            avg_accel_changes (tuple, optional): Average acceleration change in percent for Test 1→2,
+                2→3 and 3→4
+            
+        Returns:
+            bytes: Comprehensive PDF report as bytes
+        """
+        # For PDF, we'll create a sequential report with all content visible
+        # rather than using tabs/interactive features
+
+        # Missing counts are reported as 0, so clean the count frames once up front
+        # instead of checking every cell while building the tables
+        test_columns = _test_columns(power_counts)
+        power_counts = power_counts.reindex(columns=test_columns).fillna(0).astype('int64')
+        accel_counts = accel_counts.reindex(columns=test_columns).fillna(0).astype('int64')
+        
+        # Set document title with site name if provided; the name is user input, so escape it once
+        esc_site_name = html.escape(site_name)
+        title = f"Exercise Development Report - {esc_site_name}" if site_name else "Comprehensive Exercise Development Report"
+        
+        # Create the HTML structure, writing it as UTF-8 straight into the
+        # buffer WeasyPrint reads from instead of assembling one big string
+        html_buffer = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+        html_buffer.write(f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>{title}</title>
+            {_PDF_CSS_STYLES}
+        </head>
+        <body>
+        """)
+        
+        # Cover page, optional site name heading and table of contents
+        context = {
+            'title': title,
+            'date': report_date or pd.Timestamp.now().strftime('%B %d, %Y'),
+            'site_name': esc_site_name,
+            'region_items': "".join(
+                f"<li>4.{region_counter}. {esc_region}</li>"
+                for region_counter, esc_region in enumerate(_escape_labels(body_region_averages.keys()), start=1)
+            ),
+        }
+        html_buffer.write(_PDF_COVER_TEMPLATE.format_map(context))
+        if site_name:
+            html_buffer.write(_PDF_SITE_NAME_TEMPLATE.format_map(context))
+        html_buffer.write(_PDF_TOC_TEMPLATE.format_map(context))
+        
+        html_buffer.write("""
+        <h1>1. Overview</h1>
+        <div class="section">
+        """)
+        
+        # Report settings
+        html_buffer.write("""
+        <div class="filter-info">
+            <h3>Report Settings</h3>
+            <p>This report includes data processed with the following settings:</p>
+            <ul>
+                <li><strong>Date Range:</strong> All available dates</li>
+                <li><strong>Minimum Days Between Tests:</strong> 30 days</li>
+                <li><strong>Resistance Standardization:</strong> Enabled</li>
+            </ul>
+        </div>
+        """)
+        
+        # Athlete Metrics
+        html_buffer.write("""
+        <h2>Athlete Metrics</h2>
+        <div class="metric-row">
+            <div class="metric-box">
+                <div class="metric-value">42</div>
+                <div class="metric-label">Total Athletes</div>
+            </div>
+            <div class="metric-box">
+                <div class="metric-value">38</div>
+                <div class="metric-label">Valid Athletes</div>
+            </div>
+            <div class="metric-box">
+                <div class="metric-value">John Smith (12)</div>
+                <div class="metric-label">Most Active Athlete</div>
+            </div>
+        </div>
+        
+        <h2>Exercise Metrics</h2>
+        <table class="table">
+            <thead>
+                <tr>
+                    <th>Exercise Name</th>
+                    <th>Total Executions</th>
+                    <th>1st Common Resistance</th>
+                    <th>2nd Common Resistance</th>
+                    <th>3rd Common Resistance</th>
+                    <th>Valid Entries</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>Chest Press (One Hand) (Dominant)</td>
+                    <td>156</td>
+                    <td>12 lbs (98)</td>
+                    <td>10 lbs (42)</td>
+                    <td>8 lbs (16)</td>
+                    <td>142</td>
+                </tr>
+                <!-- Additional rows would be added here -->
+            </tbody>
+        </table>
+        
+        <h2>Test Session Analysis</h2>
+        <div class="metric-row">
+            <div class="metric-box">
+                <div class="metric-value">Power Test (76)</div>
+                <div class="metric-label">1st Most Common Session</div>
+            </div>
+            <div class="metric-box">
+                <div class="metric-value">Full Assessment (52)</div>
+                <div class="metric-label">2nd Most Common Session</div>
+            </div>
+            <div class="metric-box">
+                <div class="metric-value">Upper Body (28)</div>
+                <div class="metric-label">3rd Most Common Session</div>
+            </div>
+        </div>
+        </div>
+        
+        <h1>2. Group Development Analysis</h1>
+        <div class="section">
+        <h2>2.1. Single Test Users</h2>
+        <table class="table">
+            <thead>
+                <tr>
+                    <th>Development Category</th>
+                    <th>Power</th>
+                    <th>Acceleration</th>
+                </tr>
+            </thead>
+            <tbody>
+        """)
+        
+        # Add single test distribution data dynamically
+        if single_test_distribution is not None:
+            html_buffer.write(_render_single_test_rows(single_test_distribution))
+        else:
+            # Fallback to empty data if no actual data available
+            html_buffer.write(_SINGLE_TEST_FALLBACK_ROWS)
+        
+        html_buffer.write("""
+            </tbody>
+        </table>
+        
+        <h2>2.2. Multi-Test Users</h2>
+        <div class="metric-row">
+            <div class="metric-box">
+                <div class="metric-value">45.2</div>
+                <div class="metric-label">Average Days Between Tests</div>
+            </div>
+            <div class="metric-box">
+                <div class="metric-value">52.8</div>
+                <div class="metric-label">Avg Days Between Tests, with Minimum</div>
+            </div>
+        </div>
+        """)
+        
+        # Build the power and acceleration rows in a single pass over both distributions
+        combined_counts = pd.concat({'Power': power_counts, 'Accel': accel_counts}, axis=1).fillna(0)
+        n_tests = len(test_columns)
+        power_rows = []
+        accel_rows = []
+        for category, values in zip(combined_counts.index, combined_counts.to_numpy(dtype='int64').tolist()):
+            power_rows.append((category, values[:n_tests]))
+            accel_rows.append((category, values[n_tests:]))
+        
+        # Power and acceleration development distributions with their change metrics
+        html_buffer.write(self._render_pdf_distribution_section(
+            "Power Development Distribution", test_columns, power_rows,
+            "Power Change", _change_labels(avg_power_changes, _PLACEHOLDER_POWER_CHANGES)
+        ))
+        html_buffer.write(self._render_pdf_distribution_section(
+            "Acceleration Development Distribution", test_columns, accel_rows,
+            "Acceleration Change", _change_labels(avg_accel_changes, _PLACEHOLDER_ACCEL_CHANGES)
+        ))
+        html_buffer.write("""
+        </div>
+        
+        <h1>3. Transition Analysis</h1>
+        <div class="section">
+        <h2>3.1. Power Transitions</h2>
+        """)
+        html_buffer.write(_TRANSITION_READING_GUIDE)
+        
+        # Add power transition matrices with highlighting
+        for period, matrix_df in power_transitions.items():
+            html_buffer.write(f'<h3>Period: {period}</h3>')
+            
+            # Table with diagonal/above/below cell highlighting
+            html_buffer.write(_render_transition_table(matrix_df))
+        
+        html_buffer.write("<h2>3.2. Acceleration Transitions</h2>")
+        html_buffer.write(_TRANSITION_READING_GUIDE)
+        
+        # Add acceleration transition matrices with highlighting
+        for period, matrix_df in accel_transitions.items():
+            html_buffer.write(f'<h3>Period: {period}</h3>')
+            
+            # Table with diagonal/above/below cell highlighting
+            html_buffer.write(_render_transition_table(matrix_df))
+        html_buffer.write("</div>")
+        
+        html_buffer.write("""
+        <h1>4. Body Region Analysis</h1>
+        <div class="section">
+        
+        <h2>Development Score Averages by Body Region</h2>
+        <p>Values represent average development scores (percentage of goal standards).</p>
+        """)
+        
+        # Add body region averages data; missing or empty columns show as "-"
+        body_region_rows = [
+            (region, [
+                "-" if col not in data or pd.isna(data[col]) else f"{data[col]:.2f}%"
+                for col in _PDF_BODY_REGION_COLUMNS
+            ])
+            for region, data in body_region_averages.items()
+        ]
+        html_buffer.write(_PDF_BODY_REGION_TABLE_TEMPLATE.render(
+            columns=_PDF_BODY_REGION_COLUMNS, rows=body_region_rows
+        ))
+        html_buffer.write("</div>")
+        
+        # Individual region analysis sections
+        region_counter = 1
+        for region_name in body_region_averages.keys():
+            # Thresholds missing for this region, or for a period, show as N/A
+            region_context = {
+                **_PDF_THRESHOLDS_DEFAULT,
+                **improvement_thresholds.get(region_name, {}),
+                'region_name': html.escape(region_name),
+                'region_counter': region_counter,
+            }
+            
+            # Start building content for this region
+            html_buffer.write(_PDF_REGION_HEADER_TEMPLATE.format_map(region_context))
+            
+            # Underperformer lists for both periods, empty where the metrics don't carry them
+            (power_underperformers_1_2, accel_underperformers_1_2,
+             power_underperformers_2_3, accel_underperformers_2_3) = _extract_underperformers(
+                region_metrics.get(region_name)
+            )
+            
+            # Create underperformers table for Test 1 → Test 2
+            html_buffer.write(_render_underperformer_table(power_underperformers_1_2, accel_underperformers_1_2))
+            
+            html_buffer.write(_PDF_UNDERPERFORMERS_2_3_HEADING)
+            
+            # Create underperformers table for Test 2 → Test 3
+            html_buffer.write(_render_underperformer_table(power_underperformers_2_3, accel_underperformers_2_3))
+            
+            html_buffer.write(_PDF_REGION_CLOSE)
+            region_counter += 1
+        
+        # Information Guide
+        html_buffer.write(_PDF_INFORMATION_GUIDE)
+        
+        # Close the HTML document
+        html_buffer.write("""
+        </body>
+        </html>
+        """)
+        html_buffer.flush()
+        html_bytes = html_buffer.detach()
+        html_bytes.seek(0)
+        
+        # Convert HTML to PDF with specific page settings
+        pdf_buffer = io.BytesIO()
+        HTML(file_obj=html_bytes, encoding='utf-8').write_pdf(
+            pdf_buffer,
+            presentational_hints=True
+        )
+        pdf_buffer.seek(0)
+        
+        return pdf_buffer.getvalue()
+        
+    def _render_pdf_distribution_section(self, title, test_columns, rows, change_label, changes):
         """
+        Render a development distribution table followed by its change metrics for the PDF report.
         
-        # Create HTML content with navigation bar
-        # Set document title with site name if provided
-        title = f"Exercise Development Report - {site_name}" if site_name else "Comprehensive Exercise Development Report"
+        Args:
+            title (str): Section heading
+            test_columns (list): Test column labels
+            rows (list): (category, counts) pairs of the table body
+            change_label (str): Label prefix for the change metrics, e.g. "Power Change"
+            changes (tuple): Change values for Test 1→2, 2→3 and 3→4
+            
+        Returns:
+            str: HTML for the section
+        """
+        return _PDF_DISTRIBUTION_SECTION_TEMPLATE.render(
+            title=title, columns=test_columns, rows=rows, change_label=change_label, changes=changes
+        )
         
-        html_header = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{title}</title>
-            {css_styles}
-            <script>
-                function goToPage(pageId) {{
-                    document.querySelectorAll('.page').forEach(page => {{
-                        page.style.display = 'none';
-                    }});
-                    document.getElementById(pageId).style.display = 'block';
-                }}
-            </script>
-        </head>
-        <body>
-            <div class="nav">
-                <a href="#" onclick="goToPage('overview'); return false;">Overview</a>
-                <a href="#" onclick="goToPage('group-development'); return false;">Group Development</a>
-                <a href="#" onclick="goToPage('power-transitions'); return false;">Power Transitions</a>
-                <a href="#" onclick="goToPage('accel-transitions'); return false;">Acceleration Transitions</a>
+    def _write_transition_page(self, html_buffer, transitions, page_id, title, regression_placeholders):
+        """
+        Write one transitions page of the interactive HTML report.
+        
+        Args:
+            html_buffer (io.TextIOBase): Sink the page is written to
+            transitions (dict): Transition DataFrames by period
+            page_id (str): Element id of the page, used by the navigation bar
+            title (str): Page heading
+            regression_placeholders (tuple): Placeholder lines listed under each
+                period until real regression data is available
+        """
+        regression_users = "".join(
+            f'<div class="regression-user">{line}</div>' for line in regression_placeholders
+        )
+        html_buffer.write(_HTML_TRANSITIONS_PAGE_HEADER_TEMPLATE.format_map({'page_id': page_id, 'title': title}))
+        html_buffer.write(_TRANSITION_READING_GUIDE)
+        for period, matrix_df in transitions.items():
+            html_buffer.write(f'<h2>Period: {period}</h2>')
+            html_buffer.write(_render_transition_table(matrix_df))
+            html_buffer.write(f'<h3>Users who regressed in {period}:</h3>')
+            html_buffer.write(regression_users)
+            html_buffer.write("<!-- More regression users would be listed here -->")
+        html_buffer.write(_HTML_PAGE_CLOSE)
+    
+    def _write_region_page(self, html_buffer, region, region_id, esc_region, averages, improvement_thresholds,
+                           region_metrics):
+        """
+        Write one body region page of the interactive HTML report.
+        
+        Args:
+            html_buffer (io.TextIOBase): Sink the page is written to
+            region (str): Body region name
+            region_id (str): Element id of the page, used by the navigation bar
+            esc_region (str): HTML-escaped region name
+            averages (DataFrame): Group averages for the region
+            improvement_thresholds (dict): Dictionary of improvement thresholds by region
+            region_metrics (dict): Dictionary of region metrics including underperformers
+        """
+        html_buffer.write(_HTML_REGION_HEADER_TEMPLATE.format_map(
+            {'region_id': region_id, 'region_name': esc_region}
+        ))
+        
+        # Add body region averages table
+        html_buffer.write(_render_percent_table(averages))
+        
+        # Add improvement thresholds if available
+        if region in improvement_thresholds:
+            thresholds = improvement_thresholds[region]
+            html_buffer.write("""
+            <h2>Improvement Thresholds</h2>
+            <p>The following thresholds represent the group average changes between tests.</p>
+            <p>Users whose improvement falls below these values are considered underperforming.</p>
+            
+            <table class="table threshold-table">
+                <thead>
+                    <tr>
+                        <th>Metric</th>
+                        <th>Test 1 to 2</th>
+                        <th>Test 2 to 3</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td>Power</td>
+            """)
+            
+            # Add power thresholds with color coding
+            html_buffer.write(_render_threshold_cell(thresholds.get('power_1_to_2')))
+            html_buffer.write(_render_threshold_cell(thresholds.get('power_2_to_3')))
+            
+            html_buffer.write("""
+                    </tr>
+                    <tr>
+                        <td>Acceleration</td>
+            """)
+            
+            # Add acceleration thresholds with color coding
+            html_buffer.write(_render_threshold_cell(thresholds.get('accel_1_to_2')))
+            html_buffer.write(_render_threshold_cell(thresholds.get('accel_2_to_3')))
+            
+            html_buffer.write("""
+                    </tr>
+                </tbody>
+            </table>
+            """)
+        
+        # Add region metrics from region_metrics if available
+        if region in region_metrics and isinstance(region_metrics[region], tuple):
+            metrics = region_metrics[region]
+            
+            # Check if we have the region metrics data
+            if len(metrics) >= 4 and metrics[0] is not None and metrics[1] is not None:
+                power_df, accel_df = metrics[0], metrics[1]
+                
+                # Power development table
+                html_buffer.write("""
+                <h2>Power Development (%)</h2>
+                """)
+                html_buffer.write(_render_percent_table(power_df))
+                
+                # Acceleration development table
+                html_buffer.write("""
+                <h2>Acceleration Development (%)</h2>
+                """)
+                html_buffer.write(_render_percent_table(accel_df))
+                
+                # Display lowest change exercises if available
+                if len(metrics) >= 8:
+                    html_buffer.write(_render_lowest_change(*metrics[4:8]))
+            
+            # Add underperformers tables if available
+            power_changes, accel_changes = metrics[2], metrics[3]
+            
+            html_buffer.write(_render_change_underperformers('Power Underperformers (Test 1 to 2)', power_changes, 'underperformers_1_to_2'))
+            html_buffer.write(_render_change_underperformers('Power Underperformers (Test 2 to 3)', power_changes, 'underperformers_2_to_3'))
+            html_buffer.write(_render_change_underperformers('Acceleration Underperformers (Test 1 to 2)', accel_changes, 'underperformers_1_to_2'))
+            html_buffer.write(_render_change_underperformers('Acceleration Underperformers (Test 2 to 3)', accel_changes, 'underperformers_2_to_3'))
+        
+        html_buffer.write(_HTML_PAGE_CLOSE)
+    
+    def _generate_comprehensive_html(self, power_counts, accel_counts, power_transitions, accel_transitions,
+                                   body_region_averages, improvement_thresholds, region_metrics, site_name="",
+                                   single_test_distribution=None, avg_power_changes=None, avg_accel_changes=None):
+        """
+        Generate comprehensive HTML report content, reusing the cached result for unchanged inputs.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            power_transitions (dict): Dictionary of power transition matrices by period
+            accel_transitions (dict): Dictionary of acceleration transition matrices by period
+            body_region_averages (dict): Dictionary of body region averages
+            improvement_thresholds (dict): Dictionary of improvement thresholds by region
+            region_metrics (dict): Dictionary of region metrics including underperformers
+            site_name (str, optional): Name of the site/location for the report header
+            single_test_distribution (DataFrame, optional): Distribution data for single test users
+            avg_power_changes (tuple, optional): Average power change in percent for Test 1→2, 2→3 and 3→4
+            avg_accel_changes (tuple, optional): Average acceleration change in percent for Test 1→2, 2→3 and 3→4
+            
+        Returns:
+            bytes: UTF-8 encoded HTML content
+        """
+        # Styler objects cannot be hashed, so hand the cache plain DataFrames
+        return _cached_comprehensive_html(
+            power_counts, accel_counts,
+            _unwrap_transitions(power_transitions), _unwrap_transitions(accel_transitions),
+            body_region_averages, improvement_thresholds, region_metrics, site_name,
+            single_test_distribution, avg_power_changes, avg_accel_changes
+        )
+        
+    def _build_comprehensive_html(self, power_counts, accel_counts, power_transitions, accel_transitions,
+                                  body_region_averages, improvement_thresholds, region_metrics, site_name="",
+                                  single_test_distribution=None, out=None,
+                                  avg_power_changes=None, avg_accel_changes=None):
+        """
+        Generate comprehensive HTML report content with separate pages.
+        
+        Args:
+            power_counts (DataFrame): Power development distribution
+            accel_counts (DataFrame): Acceleration development distribution
+            power_transitions (dict): Dictionary of power transition DataFrames by period
+            accel_transitions (dict): Dictionary of acceleration transition DataFrames by period
+            body_region_averages (dict): Dictionary of body region averages
+            improvement_thresholds (dict): Dictionary of improvement thresholds by region
+            region_metrics (dict): Dictionary of region metrics including underperformers
+            site_name (str, optional): Name of the site/location for the report header
+            single_test_distribution (DataFrame, optional): Distribution data for single test users
+            out (file-like, optional): Text stream to write the pages to as they are generated
+            avg_power_changes (tuple, optional): Average power change in percent for Test 1→2, 2→3
+                and 3→4, shown in the metric boxes; placeholders are shown if omitted
+            avg_accel_changes (tuple, optional): Average acceleration change in percent for Test 1→2,
+                2→3 and 3→4
+            
+        Returns:
+            str: HTML content, or None if it was written to out
         """
         
+        # Create HTML content with navigation bar
+        # Set document title with site name if provided; the name is user input, so escape it once
+        esc_site_name = html.escape(site_name)
+        title = f"Exercise Development Report - {esc_site_name}" if site_name else "Comprehensive Exercise Development Report"
+        
+        # Pages are written in document order, straight to the caller's stream if given
+        html_buffer = io.StringIO() if out is None else out
+        html_buffer.write(_HTML_HEAD_TEMPLATE.format_map({'title': title, 'css_styles': _HTML_CSS_STYLES}))
+        
+        # Page id and escaped name of each region, shared by the navigation links and the region pages
+        region_labels = {
+            region: (region.lower().replace('/', '-'), html.escape(region)) for region in body_region_averages
+        }
+        
         # Add navigation links for body regions
-        for region in body_region_averages.keys():
-            region_id = region.lower().replace('/', '-')
-            html_header += f'<a href="#" onclick="goToPage(\'{region_id}\'); return false;">{region}</a>'
+        for region_id, esc_region in region_labels.values():
+            html_buffer.write(f'<a href="#" onclick="goToPage(\'{region_id}\'); return false;">{esc_region}</a>')
         
         # Add Information page link to navigation
-        html_header += '<a href="#" onclick="goToPage(\'information\'); return false;">Information</a>'
+        html_buffer.write('<a href="#" onclick="goToPage(\'information\'); return false;">Information</a>')
         
         # Close navigation and open content container
-        html_header += """
+        html_buffer.write("""
             </div>
             <div class="content">
-        """
+        """)
         
         #######################
         # 1. OVERVIEW PAGE
         #######################
-        overview_page = """
+        html_buffer.write("""
         <div id="overview" class="page" style="display: block;">
             <div class="container">
-        """
+        """)
         
         # Add site name heading if provided
         if site_name:
-            overview_page += f"""
+            html_buffer.write(f"""
             <div class="site-name">
-                <h2>{site_name}</h2>
+                <h2>{esc_site_name}</h2>
             </div>
-            """
+            """)
         
-        overview_page += """
+        html_buffer.write("""
                 <h1>Exercise Development Report</h1>
                 
                 <div class="filter-info">
                     <h3>Report Settings</h3>
                     <p>This report includes data processed with the following settings:</p>
                     <ul>
-        """
+        """)
         
         # Add filter information placeholder
-        overview_page += """
+        html_buffer.write("""
                         <li><strong>Date Range:</strong> All available dates</li>
                         <li><strong>Minimum Days Between Tests:</strong> 30 days</li>
                         <li><strong>Resistance Standardization:</strong> Enabled</li>
@@ -1488,10 +2083,10 @@ class ReportGenerator:
                 </div>
                 
                 <h2>Exercise Metrics</h2>
-        """
+        """)
         
         # Placeholder for exercise metrics
-        overview_page += """
+        html_buffer.write("""
                 <table class="table">
                     <thead>
                         <tr>
@@ -1537,17 +2132,14 @@ class ReportGenerator:
                         </div>
                     </div>
                 </div>
-        """
+        """)
                 
-        overview_page += """
-            </div>
-        </div>
-        """
+        html_buffer.write(_HTML_PAGE_CLOSE)
         
         #######################
         # 2. GROUP DEVELOPMENT ANALYSIS PAGE
         #######################
-        group_dev_page = """
+        html_buffer.write("""
         <div id="group-development" class="page" style="display: none;">
             <div class="container">
                 <h1>Group Development Analysis</h1>
@@ -1564,801 +2156,111 @@ class ReportGenerator:
                                 </tr>
                             </thead>
                             <tbody>
-                            """
+                            """)
         
         # Add dynamic single test distribution data if available
         if single_test_distribution is not None:
-            # Get the categories from index
-            categories = single_test_distribution.index
-            for category in categories:
-                group_dev_page += f"<tr><td>{category}</td>"
-                # Power column
-                if "Power" in single_test_distribution.columns:
-                    power_value = single_test_distribution.loc[category, "Power"]
-                    if pd.isna(power_value):
-                        group_dev_page += f"<td>0</td>"
-                    else:
-                        group_dev_page += f"<td>{int(power_value)}</td>"
-                else:
-                    group_dev_page += "<td>0</td>"
-                
-                # Acceleration column
-                if "Acceleration" in single_test_distribution.columns:
-                    accel_value = single_test_distribution.loc[category, "Acceleration"]
-                    if pd.isna(accel_value):
-                        group_dev_page += f"<td>0</td>"
-                    else:
-                        group_dev_page += f"<td>{int(accel_value)}</td>"
-                else:
-                    group_dev_page += "<td>0</td>"
-                
-                group_dev_page += "</tr>"
+            html_buffer.write(_render_single_test_rows(single_test_distribution))
         else:
             # Fallback to placeholder data if no actual data available
-            group_dev_page += """
-                                <tr>
-                                    <td>Goal Hit</td>
-                                    <td>0</td>
-                                    <td>0</td>
-                                </tr>
-                                <tr>
-                                    <td>Elite</td>
-                                    <td>0</td>
-                                    <td>0</td>
-                                </tr>
-                                <tr>
-                                    <td>Above Average</td>
-                                    <td>0</td>
-                                    <td>0</td>
-                                </tr>
-                                <tr>
-                                    <td>Average</td>
-                                    <td>0</td>
-                                    <td>0</td>
-                                </tr>
-                                <tr>
-                                    <td>Under Developed</td>
-                                    <td>0</td>
-                                    <td>0</td>
-                                </tr>
-                                <tr>
-                                    <td>Severely Under Developed</td>
-                                    <td>0</td>
-                                    <td>0</td>
-                                </tr>
-            """
+            html_buffer.write(_SINGLE_TEST_FALLBACK_ROWS)
         
-        group_dev_page += """
+        html_buffer.write("""
                             </tbody>
-                        </table>
-                    </div>
-                    <div class="metric-col">
-                        <div class="metric-box">
-                            <div class="metric-value">N/A</div>
-                            <div class="metric-label">Average Overall Power Development</div>
-                        </div>
-                        <div class="metric-box">
-                            <div class="metric-value">N/A</div>
-                            <div class="metric-label">Average Overall Acceleration Development</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <h2>Multi-Test Users</h2>
-                <div class="metric-row">
-                    <div class="metric-col">
-                        <div class="metric-box">
-                            <div class="metric-value">45.2</div>
-                            <div class="metric-label">Average Days Between Tests</div>
-                        </div>
-                    </div>
-                    <div class="metric-col">
-                        <div class="metric-box">
-                            <div class="metric-value">52.8</div>
-                            <div class="metric-label">Avg Days Between Tests, with Minimum</div>
-                        </div>
-                    </div>
-                </div>
-        """
-                
-        # Extract average values by test column from the original data
-        test_columns = [col for col in power_counts.columns if col.startswith('Test')]
-        power_avgs = {}
-        accel_avgs = {}
-        
-        for col in test_columns:
-            if not power_counts[col].isna().all():
-                power_avgs[col] = power_counts[col].mean()
-            if not accel_counts[col].isna().all():
-                accel_avgs[col] = accel_counts[col].mean()
-        
-        # Add Power development distribution table
-        group_dev_page += "<h3>Multi-Test Users Power Development Distribution</h3>"
-        
-        # Create a custom table for power data using the exact format as the app screenshot
-        group_dev_page += """
-        <table class="table">
-            <thead>
-                <tr>
-                    <th></th>
-        """
-        
-        # Add column headers for tests
-        for col in test_columns:
-            group_dev_page += f"<th>{col}</th>"
-        
-        group_dev_page += """
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        # Add data rows
-        for category in power_counts.index:
-            group_dev_page += f"<tr><td style='text-align: right; font-weight: 500;'>{category}</td>"
-            for col in test_columns:
-                value = power_counts.loc[category, col]
-                if pd.isna(value):
-                    group_dev_page += "<td>0</td>"
-                else:
-                    group_dev_page += f"<td>{value}</td>"
-            group_dev_page += "</tr>"
-        
-        group_dev_page += """
-            </tbody>
-        </table>
-        """
-        
-        # Add Power change metrics - use actual calculated values from the data if available
-        group_dev_page += """<div class="metric-row">"""
-        
-        # Extract actual change values from the data (or use placeholders if not available)
-        if 'avg_power_change_1_2' in locals():
-            power_change_1_2 = locals()['avg_power_change_1_2']
-        else:
-            power_change_1_2 = "+4.2" # placeholder
-            
-        if 'avg_power_change_2_3' in locals():
-            power_change_2_3 = locals()['avg_power_change_2_3']
-        else:
-            power_change_2_3 = "+3.8" # placeholder
-            
-        if 'avg_power_change_3_4' in locals():
-            power_change_3_4 = locals()['avg_power_change_3_4']
-        else:
-            power_change_3_4 = "+2.5" # placeholder
-        
-        # Create metric boxes
-        group_dev_page += f"""
-                    <div class="metric-col">
-                        <div class="metric-box">
-                            <div class="metric-value">{power_change_1_2}%</div>
-                            <div class="metric-label">Power Change (Test 1→2)</div>
-                        </div>
-                    </div>
-                    <div class="metric-col">
-                        <div class="metric-box">
-                            <div class="metric-value">{power_change_2_3}%</div>
-                            <div class="metric-label">Power Change (Test 2→3)</div>
-                        </div>
-                    </div>
-                    <div class="metric-col">
-                        <div class="metric-box">
-                            <div class="metric-value">{power_change_3_4}%</div>
-                            <div class="metric-label">Power Change (Test 3→4)</div>
-                        </div>
-                    </div>
-                </div>
-        """
-        
-        # Add Acceleration development distribution
-        group_dev_page += "<h3>Multi-Test Users Acceleration Development Distribution</h3>"
-        
-        # Create a custom table for acceleration data using the exact format as the app screenshot
-        group_dev_page += """
-        <table class="table">
-            <thead>
-                <tr>
-                    <th></th>
-        """
-        
-        # Add column headers for tests
-        for col in test_columns:
-            group_dev_page += f"<th>{col}</th>"
-        
-        group_dev_page += """
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        # Add data rows
-        for category in accel_counts.index:
-            group_dev_page += f"<tr><td style='text-align: right; font-weight: 500;'>{category}</td>"
-            for col in test_columns:
-                value = accel_counts.loc[category, col]
-                if pd.isna(value):
-                    group_dev_page += "<td>0</td>"
-                else:
-                    group_dev_page += f"<td>{value}</td>"
-            group_dev_page += "</tr>"
-        
-        group_dev_page += """
-            </tbody>
-        </table>
-        """
-        
-        # Add Acceleration change metrics - use actual calculated values if available
-        group_dev_page += """<div class="metric-row">"""
-        
-        # Extract actual change values from the data (or use placeholders if not available)
-        if 'avg_accel_change_1_2' in locals():
-            accel_change_1_2 = locals()['avg_accel_change_1_2']
-        else:
-            accel_change_1_2 = "+5.1" # placeholder
-            
-        if 'avg_accel_change_2_3' in locals():
-            accel_change_2_3 = locals()['avg_accel_change_2_3']
-        else:
-            accel_change_2_3 = "+4.3" # placeholder
-            
-        if 'avg_accel_change_3_4' in locals():
-            accel_change_3_4 = locals()['avg_accel_change_3_4']
-        else:
-            accel_change_3_4 = "+3.1" # placeholder
-        
-        # Create metric boxes
-        group_dev_page += f"""
+                        </table>
+                    </div>
                     <div class="metric-col">
                         <div class="metric-box">
-                            <div class="metric-value">{accel_change_1_2}%</div>
-                            <div class="metric-label">Acceleration Change (Test 1→2)</div>
+                            <div class="metric-value">N/A</div>
+                            <div class="metric-label">Average Overall Power Development</div>
+                        </div>
+                        <div class="metric-box">
+                            <div class="metric-value">N/A</div>
+                            <div class="metric-label">Average Overall Acceleration Development</div>
                         </div>
                     </div>
+                </div>
+                
+                <h2>Multi-Test Users</h2>
+                <div class="metric-row">
                     <div class="metric-col">
                         <div class="metric-box">
-                            <div class="metric-value">{accel_change_2_3}%</div>
-                            <div class="metric-label">Acceleration Change (Test 2→3)</div>
+                            <div class="metric-value">45.2</div>
+                            <div class="metric-label">Average Days Between Tests</div>
                         </div>
                     </div>
                     <div class="metric-col">
                         <div class="metric-box">
-                            <div class="metric-value">{accel_change_3_4}%</div>
-                            <div class="metric-label">Acceleration Change (Test 3→4)</div>
+                            <div class="metric-value">52.8</div>
+                            <div class="metric-label">Avg Days Between Tests, with Minimum</div>
                         </div>
                     </div>
                 </div>
-            </div>
-        </div>
-        """
+        """)
+                
+        # Extract average values by test column from the original data
+        test_columns = _test_columns(power_counts)
+        # Column means skip NaN, so only all-empty test columns come out NaN and are dropped
+        power_avgs = power_counts[test_columns].mean().dropna().to_dict()
+        accel_avgs = accel_counts[test_columns].mean().dropna().to_dict()
+        
+        # Add Power development distribution table
+        html_buffer.write("<h3>Multi-Test Users Power Development Distribution</h3>")
+        
+        # Create a custom table for power data using the exact format as the app screenshot
+        html_buffer.write(_render_multi_test_table(power_counts, test_columns))
+        
+        # Power change metrics, from the supplied averages or placeholders when none were given
+        html_buffer.write(_render_change_metrics(
+            "Power Change", _change_labels(avg_power_changes, _PLACEHOLDER_POWER_CHANGES)
+        ))
+        
+        # Add Acceleration development distribution
+        html_buffer.write("<h3>Multi-Test Users Acceleration Development Distribution</h3>")
+        
+        # Create a custom table for acceleration data using the exact format as the app screenshot
+        html_buffer.write(_render_multi_test_table(accel_counts, test_columns))
+        
+        # Acceleration change metrics, from the supplied averages or placeholders when none were given
+        html_buffer.write(_render_change_metrics(
+            "Acceleration Change", _change_labels(avg_accel_changes, _PLACEHOLDER_ACCEL_CHANGES)
+        ))
+        
+        html_buffer.write(_HTML_PAGE_CLOSE)
         
         #######################
         # 3. POWER TRANSITIONS PAGE
         #######################
-        power_transitions_page = """
-        <div id="power-transitions" class="page" style="display: none;">
-            <div class="container">
-                <h1>Power Transitions Analysis</h1>
-                <div class="filter-info">
-                    <p><strong>Reading Guide:</strong> Rows show starting bracket, columns show ending bracket. 
-                    Numbers show count of users who made each transition.</p>
-                    <ul>
-                        <li><span style="color: #4da6ff; font-weight: bold;">Blue cells</span> show users who remained in the same bracket.</li>
-                        <li><span style="color: #ff6b6b; font-weight: bold;">Red cells</span> show regression to lower brackets.</li>
-                        <li><span style="color: #4dff4d; font-weight: bold;">Green cells</span> show improvement to higher brackets.</li>
-                    </ul>
-                </div>
-        """
-        
-        # Add power transition matrices with highlighting
-        for period, matrix in power_transitions.items():
-            power_transitions_page += f'<h2>Period: {period}</h2>'
-            
-            # If matrix is a Styler object, get the underlying DataFrame
-            if hasattr(matrix, 'data'):
-                matrix_df = matrix.data
-            else:
-                matrix_df = matrix
-                
-            # Apply styling to highlight cells (can't use Styler functions directly in HTML)
-            power_transitions_page += """
-            <table class="table">
-                <thead>
-                    <tr>
-                        <th>From \ To</th>
-            """
-            
-            # Add column headers
-            for col in matrix_df.columns:
-                power_transitions_page += f'<th>{col}</th>'
-            
-            power_transitions_page += """
-                    </tr>
-                </thead>
-                <tbody>
-            """
-            
-            # Add rows with appropriate cell highlighting
-            for i, row_idx in enumerate(matrix_df.index):
-                power_transitions_page += f'<tr><td>{row_idx}</td>'
-                
-                for j, col in enumerate(matrix_df.columns):
-                    value = matrix_df.iloc[i, j]
-                    # Determine cell color based on position
-                    if i == j:  # Diagonal - no change
-                        cell_class = "diagonal"
-                    elif i < j:  # Above diagonal - regression
-                        cell_class = "above-diagonal"
-                    else:  # Below diagonal - improvement
-                        cell_class = "below-diagonal"
-                    
-                    power_transitions_page += f'<td class="{cell_class}">{value}</td>'
-                
-                power_transitions_page += '</tr>'
-            
-            power_transitions_page += """
-                </tbody>
-            </table>
-            """
-            
-            # Add space for regression users list (placeholder, to be replaced with actual data)
-            power_transitions_page += f'<h3>Users who regressed in {period}:</h3>'
-            power_transitions_page += """
-            <div class="regression-user">John Smith: Moved from Elite to Average</div>
-            <div class="regression-user">Jane Doe: Moved from Above Average to Under Developed</div>
-            <!-- More regression users would be listed here -->
-            """
-        
-        power_transitions_page += """
-            </div>
-        </div>
-        """
+        self._write_transition_page(
+            html_buffer, power_transitions, 'power-transitions', 'Power Transitions Analysis',
+            ("John Smith: Moved from Elite to Average",
+             "Jane Doe: Moved from Above Average to Under Developed")
+        )
         
         #######################
         # 4. ACCELERATION TRANSITIONS PAGE
         #######################
-        accel_transitions_page = """
-        <div id="accel-transitions" class="page" style="display: none;">
-            <div class="container">
-                <h1>Acceleration Transitions Analysis</h1>
-                <div class="filter-info">
-                    <p><strong>Reading Guide:</strong> Rows show starting bracket, columns show ending bracket. 
-                    Numbers show count of users who made each transition.</p>
-                    <ul>
-                        <li><span style="color: #4da6ff; font-weight: bold;">Blue cells</span> show users who remained in the same bracket.</li>
-                        <li><span style="color: #ff6b6b; font-weight: bold;">Red cells</span> show regression to lower brackets.</li>
-                        <li><span style="color: #4dff4d; font-weight: bold;">Green cells</span> show improvement to higher brackets.</li>
-                    </ul>
-                </div>
-        """
-        
-        # Add acceleration transition matrices with highlighting
-        for period, matrix in accel_transitions.items():
-            accel_transitions_page += f'<h2>Period: {period}</h2>'
-            
-            # If matrix is a Styler object, get the underlying DataFrame
-            if hasattr(matrix, 'data'):
-                matrix_df = matrix.data
-            else:
-                matrix_df = matrix
-                
-            # Apply styling to highlight cells
-            accel_transitions_page += """
-            <table class="table">
-                <thead>
-                    <tr>
-                        <th>From \ To</th>
-            """
-            
-            # Add column headers
-            for col in matrix_df.columns:
-                accel_transitions_page += f'<th>{col}</th>'
-            
-            accel_transitions_page += """
-                    </tr>
-                </thead>
-                <tbody>
-            """
-            
-            # Add rows with appropriate cell highlighting
-            for i, row_idx in enumerate(matrix_df.index):
-                accel_transitions_page += f'<tr><td>{row_idx}</td>'
-                
-                for j, col in enumerate(matrix_df.columns):
-                    value = matrix_df.iloc[i, j]
-                    # Determine cell color based on position
-                    if i == j:  # Diagonal - no change
-                        cell_class = "diagonal"
-                    elif i < j:  # Above diagonal - regression
-                        cell_class = "above-diagonal"
-                    else:  # Below diagonal - improvement
-                        cell_class = "below-diagonal"
-                    
-                    accel_transitions_page += f'<td class="{cell_class}">{value}</td>'
-                
-                accel_transitions_page += '</tr>'
-            
-            accel_transitions_page += """
-                </tbody>
-            </table>
-            """
-            
-            # Add space for regression users list (placeholder, to be replaced with actual data)
-            accel_transitions_page += f'<h3>Users who regressed in {period}:</h3>'
-            accel_transitions_page += """
-            <div class="regression-user">Sarah Johnson: Moved from Elite to Average</div>
-            <div class="regression-user">Mike Wilson: Moved from Above Average to Under Developed</div>
-            <!-- More regression users would be listed here -->
-            """
-        
-        accel_transitions_page += """
-            </div>
-        </div>
-        """
+        self._write_transition_page(
+            html_buffer, accel_transitions, 'accel-transitions', 'Acceleration Transitions Analysis',
+            ("Sarah Johnson: Moved from Elite to Average",
+             "Mike Wilson: Moved from Above Average to Under Developed")
+        )
         
         #######################
         # 5-8. BODY REGION PAGES
         #######################
-        region_pages = ""
         for region, averages in body_region_averages.items():
-            region_id = region.lower().replace('/', '-')
-            
-            region_pages += f"""
-            <div id="{region_id}" class="page" style="display: none;">
-                <div class="container">
-                    <h1>{region} Region Analysis</h1>
-                    
-                    <h2>Group Averages</h2>
-            """
-            
-            # Add body region averages table with formatting directly
-            styled_averages = averages.style.format("{:.2f}%").to_html(classes='table')
-            region_pages += styled_averages
-            
-            # Add improvement thresholds if available
-            if region in improvement_thresholds:
-                thresholds = improvement_thresholds[region]
-                region_pages += """
-                <h2>Improvement Thresholds</h2>
-                <p>The following thresholds represent the group average changes between tests.</p>
-                <p>Users whose improvement falls below these values are considered underperforming.</p>
-                
-                <table class="table threshold-table">
-                    <thead>
-                        <tr>
-                            <th>Metric</th>
-                            <th>Test 1 to 2</th>
-                            <th>Test 2 to 3</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        <tr>
-                            <td>Power</td>
-                """
-                
-                # Add power thresholds with color coding
-                power_1_to_2 = thresholds.get('power_1_to_2')
-                if power_1_to_2 is not None and not pd.isna(power_1_to_2):
-                    color_class = "positive" if power_1_to_2 >= 0 else "negative"
-                    region_pages += f'<td class="{color_class}">{power_1_to_2:.2f}%</td>'
-                else:
-                    region_pages += '<td>Not enough data</td>'
-                    
-                power_2_to_3 = thresholds.get('power_2_to_3')
-                if power_2_to_3 is not None and not pd.isna(power_2_to_3):
-                    color_class = "positive" if power_2_to_3 >= 0 else "negative"
-                    region_pages += f'<td class="{color_class}">{power_2_to_3:.2f}%</td>'
-                else:
-                    region_pages += '<td>Not enough data</td>'
-                
-                region_pages += """
-                        </tr>
-                        <tr>
-                            <td>Acceleration</td>
-                """
-                
-                # Add acceleration thresholds with color coding
-                accel_1_to_2 = thresholds.get('accel_1_to_2')
-                if accel_1_to_2 is not None and not pd.isna(accel_1_to_2):
-                    color_class = "positive" if accel_1_to_2 >= 0 else "negative"
-                    region_pages += f'<td class="{color_class}">{accel_1_to_2:.2f}%</td>'
-                else:
-                    region_pages += '<td>Not enough data</td>'
-                    
-                accel_2_to_3 = thresholds.get('accel_2_to_3')
-                if accel_2_to_3 is not None and not pd.isna(accel_2_to_3):
-                    color_class = "positive" if accel_2_to_3 >= 0 else "negative"
-                    region_pages += f'<td class="{color_class}">{accel_2_to_3:.2f}%</td>'
-                else:
-                    region_pages += '<td>Not enough data</td>'
-                
-                region_pages += """
-                        </tr>
-                    </tbody>
-                </table>
-                """
-            
-            # Add region metrics from region_metrics if available
-            if region in region_metrics and isinstance(region_metrics[region], tuple):
-                metrics = region_metrics[region]
-                
-                # Check if we have the region metrics data
-                if len(metrics) >= 4 and metrics[0] is not None and metrics[1] is not None:
-                    power_df, accel_df = metrics[0], metrics[1]
-                    
-                    # Power development table
-                    region_pages += """
-                    <h2>Power Development (%)</h2>
-                    """
-                    # Convert to HTML with formatting directly - using two decimal places
-                    power_styled = power_df.style.format("{:.2f}%").to_html(classes='table')
-                    region_pages += power_styled
-                    
-                    # Acceleration development table
-                    region_pages += """
-                    <h2>Acceleration Development (%)</h2>
-                    """
-                    # Convert to HTML with formatting directly - using two decimal places
-                    accel_styled = accel_df.style.format("{:.2f}%").to_html(classes='table')
-                    region_pages += accel_styled
-                    
-                    # Display lowest change exercises if available
-                    if len(metrics) >= 8:
-                        lowest_power_exercise = metrics[4]
-                        lowest_power_value = metrics[5]
-                        lowest_accel_exercise = metrics[6]
-                        lowest_accel_value = metrics[7]
-                        
-                        # Create tables for lowest change exercises
-                        region_pages += """
-                        <h3>Exercises with Lowest Change</h3>
-                        <table class="table">
-                            <thead>
-                                <tr>
-                                    <th>Metric</th>
-                                    <th>Exercise</th>
-                                    <th>Change</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                        """
-                            
-                        if lowest_power_exercise and lowest_power_value is not None:
-                            color_class = "positive" if lowest_power_value >= 0 else "negative"
-                            region_pages += f"""
-                                <tr>
-                                    <td>Power</td>
-                                    <td>{lowest_power_exercise}</td>
-                                    <td class="{color_class}">{lowest_power_value:.2f}%</td>
-                                </tr>
-                            """
-                            
-                        if lowest_accel_exercise and lowest_accel_value is not None:
-                            color_class = "positive" if lowest_accel_value >= 0 else "negative"
-                            region_pages += f"""
-                                <tr>
-                                    <td>Acceleration</td>
-                                    <td>{lowest_accel_exercise}</td>
-                                    <td class="{color_class}">{lowest_accel_value:.2f}%</td>
-                                </tr>
-                            """
-                            
-                        region_pages += """
-                            </tbody>
-                        </table>
-                        """
-                
-                # Add underperformers tables if available
-                power_changes, accel_changes = metrics[2], metrics[3]
-                
-                if isinstance(power_changes, dict) and 'underperformers_1_to_2' in power_changes and power_changes['underperformers_1_to_2']:
-                    region_pages += """
-                    <h3>Power Underperformers (Test 1 to 2)</h3>
-                    <table class="table underperformers-table">
-                        <thead>
-                            <tr>
-                                <th>User Name</th>
-                                <th>Change (%)</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                    """
-                    
-                    for user, change in power_changes['underperformers_1_to_2']:
-                        color_class = "positive" if change >= 0 else "negative"
-                        region_pages += f"""
-                            <tr>
-                                <td>{user}</td>
-                                <td class="{color_class}">{change:.2f}%</td>
-                            </tr>
-                        """
-                    
-                    region_pages += """
-                        </tbody>
-                    </table>
-                    """
-                
-                if isinstance(power_changes, dict) and 'underperformers_2_to_3' in power_changes and power_changes['underperformers_2_to_3']:
-                    region_pages += """
-                    <h3>Power Underperformers (Test 2 to 3)</h3>
-                    <table class="table underperformers-table">
-                        <thead>
-                            <tr>
-                                <th>User Name</th>
-                                <th>Change (%)</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                    """
-                    
-                    for user, change in power_changes['underperformers_2_to_3']:
-                        color_class = "positive" if change >= 0 else "negative"
-                        region_pages += f"""
-                            <tr>
-                                <td>{user}</td>
-                                <td class="{color_class}">{change:.2f}%</td>
-                            </tr>
-                        """
-                    
-                    region_pages += """
-                        </tbody>
-                    </table>
-                    """
-                
-                if isinstance(accel_changes, dict) and 'underperformers_1_to_2' in accel_changes and accel_changes['underperformers_1_to_2']:
-                    region_pages += """
-                    <h3>Acceleration Underperformers (Test 1 to 2)</h3>
-                    <table class="table underperformers-table">
-                        <thead>
-                            <tr>
-                                <th>User Name</th>
-                                <th>Change (%)</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                    """
-                    
-                    for user, change in accel_changes['underperformers_1_to_2']:
-                        color_class = "positive" if change >= 0 else "negative"
-                        region_pages += f"""
-                            <tr>
-                                <td>{user}</td>
-                                <td class="{color_class}">{change:.2f}%</td>
-                            </tr>
-                        """
-                    
-                    region_pages += """
-                        </tbody>
-                    </table>
-                    """
-                
-                if isinstance(accel_changes, dict) and 'underperformers_2_to_3' in accel_changes and accel_changes['underperformers_2_to_3']:
-                    region_pages += """
-                    <h3>Acceleration Underperformers (Test 2 to 3)</h3>
-                    <table class="table underperformers-table">
-                        <thead>
-                            <tr>
-                                <th>User Name</th>
-                                <th>Change (%)</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                    """
-                    
-                    for user, change in accel_changes['underperformers_2_to_3']:
-                        color_class = "positive" if change >= 0 else "negative"
-                        region_pages += f"""
-                            <tr>
-                                <td>{user}</td>
-                                <td class="{color_class}">{change:.2f}%</td>
-                            </tr>
-                        """
-                    
-                    region_pages += """
-                        </tbody>
-                    </table>
-                    """
-            
-            region_pages += """
-                </div>
-            </div>
-            """
+            self._write_region_page(
+                html_buffer, region, *region_labels[region], averages, improvement_thresholds, region_metrics
+            )
         
         #######################
         # 9. INFORMATION AND READING GUIDE PAGE
         #######################
-        information_page = """
-        <div id="information" class="page" style="display: none;">
-            <div class="container">
-                <h1>Information and Reading Guide</h1>
-                
-                <h2>Development Score Calculation</h2>
-                <p>Development scores are calculated as a percentage of goal standards for each exercise:</p>
-                <pre>Development Score = (User's value / Goal standard) × 100</pre>
-                
-                <h3>Development Brackets</h3>
-                <p>Development scores are categorized into the following brackets:</p>
-                <table class="table">
-                    <thead>
-                        <tr>
-                            <th>Bracket</th>
-                            <th>Score Range</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        <tr><td>Goal Hit</td><td>100% and above</td></tr>
-                        <tr><td>Elite</td><td>90% - 99.99%</td></tr>
-                        <tr><td>Above Average</td><td>76% - 90%</td></tr>
-                        <tr><td>Average</td><td>51% - 75%</td></tr>
-                        <tr><td>Under Developed</td><td>26% - 50%</td></tr>
-                        <tr><td>Severely Under Developed</td><td>0% - 25%</td></tr>
-                    </tbody>
-                </table>
-                
-                <h2>Data Organization</h2>
-                
-                <h3>Test Instances</h3>
-                <p>Chronological "test instances" are created for each user by organizing exercises by date:</p>
-                <ul>
-                    <li>The first chronological exercise becomes part of Test 1</li>
-                    <li>The next exercise becomes part of Test 2, and so on</li>
-                    <li>If an exercise is repeated, it occupies the next available test instance</li>
-                </ul>
-                <p>This approach allows tracking improvement over time across different exercises.</p>
-                
-                <h3>Improvement Threshold</h3>
-                <p>The improvement threshold is calculated as the average percentage change across all users
-                for a specific body region between consecutive tests. This serves as a reference point
-                to determine which users are underperforming relative to the group average.</p>
-                
-                <h3>Minimum Days Between Tests</h3>
-                <p>When the minimum days filter is applied:</p>
-                <ol>
-                    <li>The first chronological test for each exercise is always included</li>
-                    <li>Subsequent tests are only included if they occur at least the specified number of days after the previous test</li>
-                    <li>This filtering is done at the raw data level before organizing into test instances</li>
-                </ol>
-                
-                <h2>Color Coding Guide</h2>
-                
-                <h3>Transition Matrix Colors</h3>
-                <ul>
-                    <li><span style="color: #4da6ff; font-weight: bold;">Blue cells</span> show users who remained in the same bracket.</li>
-                    <li><span style="color: #ff6b6b; font-weight: bold;">Red cells</span> show regression to lower brackets.</li>
-                    <li><span style="color: #4dff4d; font-weight: bold;">Green cells</span> show improvement to higher brackets.</li>
-                </ul>
-                
-                <h3>Value Colors</h3>
-                <ul>
-                    <li><span class="positive">Green values</span> indicate positive changes or improvements.</li>
-                    <li><span class="negative">Red values</span> indicate negative changes or regressions.</li>
-                </ul>
-                
-                <h2>Filtering Information</h2>
-                
-                <h3>Resistance Standardization</h3>
-                <p>When enabled, only includes data where exercises were performed at standard resistance values.
-                A small tolerance (±0.5 lbs) is allowed to account for minor variations.</p>
-                
-                <h3>Evaluation Window</h3>
-                <p>Filters data to a specific date range, allowing focus on particular testing periods.</p>
-                
-                <h3>Minimum Days Between Tests</h3>
-                <p>Ensures tests for the same exercise are separated by at least the specified number of days.
-                This helps prevent including tests that are too close together, which might not reflect
-                meaningful physiological changes.</p>
-            </div>
-        </div>
-        """
-        
-        # Combine all pages
-        html_content = html_header + overview_page + group_dev_page + power_transitions_page + accel_transitions_page + region_pages + information_page
+        html_buffer.write(_HTML_INFORMATION_PAGE)
         
         # Close content div and body/html tags
-        html_content += """
-            </div>
-        </body>
-        </html>
-        """
+        html_buffer.write(_HTML_FOOTER)
         
-        return html_content
\ No newline at end of file
+        if out is None:
+            return html_buffer.getvalue()